@@ -12,9 +12,76 @@
 6. 計算腿部角度
 """
 
+import math
 import numpy as np
 from typing import Dict, Optional, Tuple
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """未安裝 numba 時退回純 Python（math 純量運算，仍免去小向量的 numpy 開銷）"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# ==================== 角度運算核心（純量，可 JIT 編譯） ====================
+
+@njit(cache=True, fastmath=True)
+def _angle_deg(ax, ay, az, bx, by, bz, cx, cy, cz):
+    """三點夾角（頂點為 b），單位：度"""
+    v1x, v1y, v1z = ax - bx, ay - by, az - bz
+    v2x, v2y, v2z = cx - bx, cy - by, cz - bz
+    dot = v1x * v2x + v1y * v2y + v1z * v2z
+    norm = (math.sqrt(v1x * v1x + v1y * v1y + v1z * v1z)
+            * math.sqrt(v2x * v2x + v2y * v2y + v2z * v2z))
+    cos_angle = dot / (norm + 1e-8)
+    cos_angle = min(1.0, max(-1.0, cos_angle))
+    return math.degrees(math.acos(cos_angle))
+
+
+@njit(cache=True, fastmath=True)
+def _vertical_angle_deg(ax, ay, bx, by):
+    """b→a 連線（x, y）與垂直向上方向的夾角，單位：度"""
+    vx = ax - bx
+    vy = ay - by
+    # 與 (0, -1) 的內積為 -vy
+    cos_angle = -vy / (math.sqrt(vx * vx + vy * vy) + 1e-8)
+    cos_angle = min(1.0, max(-1.0, cos_angle))
+    return math.degrees(math.acos(cos_angle))
+
+
+NUM_POSE_LANDMARKS = 33
+
+
+def landmarks_to_array(landmarks, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    將 MediaPipe pose landmarks 一次轉為 (33, 4) 陣列 [x, y, z, visibility]
+
+    每幀只做一次屬性存取，後續角度計算與繪圖皆讀取此連續陣列。
+
+    Args:
+        landmarks: MediaPipe pose landmarks
+        out: 可重複使用的輸出緩衝區 (33, 4) float64
+
+    Returns:
+        填好座標的陣列（即 out）
+    """
+    if out is None:
+        out = np.empty((NUM_POSE_LANDMARKS, 4), dtype=np.float64)
+    for i, lm in enumerate(landmarks.landmark):
+        row = out[i]
+        row[0] = lm.x
+        row[1] = lm.y
+        row[2] = lm.z
+        row[3] = lm.visibility
+    return out
+
+
 class AngleCalculator:
     """角度計算器"""
     
@@ -56,6 +123,11 @@ class AngleCalculator:
     def __init__(self):
         """初始化"""
         self.min_visibility = 0.5  # 最低可見度閾值
+
+        # 預先觸發 JIT 編譯，避免第一個實際影格承擔編譯延遲
+        if NUMBA_AVAILABLE:
+            _angle_deg(1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+            _vertical_angle_deg(0.0, 0.0, 0.0, 1.0)
         
     def calculate_angle(self, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> float:
         """
@@ -69,16 +141,9 @@ class AngleCalculator:
         Returns:
             角度（度）
         """
-        # 創建向量
-        v1 = p1 - p2
-        v2 = p3 - p2
-        
-        # 計算角度
-        cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-8)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.arccos(cos_angle)
-        
-        return np.degrees(angle)
+        return _angle_deg(float(p1[0]), float(p1[1]), float(p1[2]),
+                          float(p2[0]), float(p2[1]), float(p2[2]),
+                          float(p3[0]), float(p3[1]), float(p3[2]))
     
     def calculate_angle_from_vertical(self, p1: np.ndarray, p2: np.ndarray) -> float:
         """
@@ -91,29 +156,34 @@ class AngleCalculator:
         Returns:
             與垂直線的夾角（度）
         """
-        # 計算向量
-        vector = p1[:2] - p2[:2]  # 只使用x, y座標
-        vertical = np.array([0, -1])  # 垂直向下
-        
-        # 計算角度
-        cos_angle = np.dot(vector, vertical) / (np.linalg.norm(vector) * np.linalg.norm(vertical) + 1e-8)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.arccos(cos_angle)
-        
-        return np.degrees(angle)
+        # 只使用x, y座標
+        return _vertical_angle_deg(float(p1[0]), float(p1[1]),
+                                   float(p2[0]), float(p2[1]))
     
     def extract_keypoint(self, landmarks, index: int) -> Optional[np.ndarray]:
         """
         提取關鍵點座標
         
         Args:
-            landmarks: MediaPipe landmarks
+            landmarks: MediaPipe landmarks 或 landmarks_to_array() 產生的陣列
             index: 關鍵點索引
             
         Returns:
             座標 [x, y, z, visibility] 或 None
         """
-        if landmarks is None or index >= len(landmarks.landmark):
+        if landmarks is None:
+            return None
+
+        if isinstance(landmarks, np.ndarray):
+            if index >= len(landmarks):
+                return None
+            point = landmarks[index]
+            # 檢查可見度
+            if point[3] < self.min_visibility:
+                return None
+            return point
+
+        if index >= len(landmarks.landmark):
             return None
         
         landmark = landmarks.landmark[index]
@@ -339,12 +409,15 @@ class AngleCalculator:
         計算所有REBA所需角度
         
         Args:
-            landmarks: MediaPipe pose landmarks
+            landmarks: MediaPipe pose landmarks 或 landmarks_to_array() 產生的陣列
             side: 'left' 或 'right' (用於上肢和下肢)
             
         Returns:
             包含所有角度的字典
         """
+        if landmarks is not None and not isinstance(landmarks, np.ndarray):
+            landmarks = landmarks_to_array(landmarks)
+
         angles = {
             'neck': self.calculate_neck_angle(landmarks),
             'trunk': self.calculate_trunk_angle(landmarks),
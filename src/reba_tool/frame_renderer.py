@@ -59,7 +59,18 @@ class FrameRenderer:
         else:
             return self._LEFT_LANDMARKS | self._CENTER_LANDMARKS | {9, 10, 11, 12, 23, 24}
 
-    def draw_pose_landmarks(self, frame, landmarks, mp_drawing, mp_holistic, mp_drawing_styles, side=None):
+    @staticmethod
+    def _to_pixels(landmarks, w, h):
+        """landmarks（MediaPipe 或 (33, 4) 陣列）→ 整數像素座標清單，一次向量化換算"""
+        if isinstance(landmarks, np.ndarray):
+            xy = landmarks[:, :2] * (w, h)
+        else:
+            xy = np.array([(lm.x * w, lm.y * h) for lm in landmarks.landmark])
+        # int() 向零截斷，與 astype 行為一致
+        return [tuple(p) for p in xy.astype(np.int64).tolist()]
+
+    def draw_pose_landmarks(self, frame, landmarks, mp_drawing, mp_holistic, mp_drawing_styles,
+                            side=None, points=None):
         """
         繪製姿態關鍵點（支援側邊過濾）
 
@@ -70,6 +81,8 @@ class FrameRenderer:
             mp_holistic: mediapipe.solutions.holistic
             mp_drawing_styles: mediapipe.solutions.drawing_styles
             side: 'left'/'right' 僅畫該側，None 畫全部
+            points: 可選，landmarks_to_array() 產生的 (33, 4) 陣列，
+                側邊過濾模式下直接讀取，不再逐一存取 landmark 屬性
         """
         if side is None:
             mp_drawing.draw_landmarks(
@@ -80,18 +93,13 @@ class FrameRenderer:
             filtered_conns = self._filter_connections_by_side(mp_holistic.POSE_CONNECTIONS, side)
             visible_indices = self._get_visible_landmarks(side)
             h, w = frame.shape[:2]
+            pixels = self._to_pixels(landmarks if points is None else points, w, h)
             # 繪製連線
             for a, b in filtered_conns:
-                lm_a = landmarks.landmark[a]
-                lm_b = landmarks.landmark[b]
-                pt_a = (int(lm_a.x * w), int(lm_a.y * h))
-                pt_b = (int(lm_b.x * w), int(lm_b.y * h))
-                cv2.line(frame, pt_a, pt_b, (0, 255, 0), 2)
+                cv2.line(frame, pixels[a], pixels[b], (0, 255, 0), 2)
             # 繪製關鍵點
             for idx in visible_indices:
-                lm = landmarks.landmark[idx]
-                pt = (int(lm.x * w), int(lm.y * h))
-                cv2.circle(frame, pt, 4, (0, 0, 255), -1)
+                cv2.circle(frame, pixels[idx], 4, (0, 0, 255), -1)
 
     def draw_angle_lines(self, frame, landmarks, angles, side, show_lines, show_values):
         """
@@ -99,7 +107,7 @@ class FrameRenderer:
 
         Args:
             frame: OpenCV 影像
-            landmarks: MediaPipe pose landmarks
+            landmarks: MediaPipe pose landmarks 或 landmarks_to_array() 產生的陣列
             angles: 角度字典
             side: 分析側邊 ('left' / 'right')
             show_lines: 是否顯示角度線
@@ -116,9 +124,10 @@ class FrameRenderer:
         cfg = self.config
         ac = self.angle_calc
 
+        pixels = self._to_pixels(landmarks, w, h)
+
         def get_point(idx):
-            lm = landmarks.landmark[idx]
-            return (int(lm.x * w), int(lm.y * h))
+            return pixels[idx]
 
         # 頸部角度線（紅色）
         if show_lines and angles.get('neck') is not None:
@@ -13,16 +13,26 @@ class ProcessingConfig:
     # ========== 影片擷取設定 ==========
     VIDEO_CAPTURE_WIDTH = 1280
     VIDEO_CAPTURE_HEIGHT = 720
+    USE_MJPEG = True  # 攝影機以 MJPEG 格式傳輸
+    USE_HW_ACCEL = True  # 影片檔使用 FFMPEG 硬體解碼
 
     # ========== MediaPipe 設定 ==========
     MEDIAPIPE_MODEL_COMPLEXITY = 0  # 0=Lite, 1=Full, 2=Heavy
     MIN_DETECTION_CONFIDENCE = 0.5
     MIN_TRACKING_CONFIDENCE = 0.5
+    ENABLE_PREVIEW_MODEL = True  # 暫停跳轉預覽時以輕量模型分析姿態
+    PREVIEW_MODEL_COMPLEXITY = 0
 
     # ========== 效能優化設定 ==========
     PROCESS_EVERY_N_FRAMES = 1  # 1=不跳幀
-    USE_GPU_BACKEND = False
-    PROCESS_LOOP_DELAY_MS = 0  # 0=最快
+    USE_GPU_BACKEND = False  # True=以 OpenCL (cv2.UMat) 執行色彩轉換
+    PROCESS_LOOP_DELAY_MS = 0  # 每幀最短間隔（截止時間節拍），0=最快
+    PIPELINE_QUEUE_SIZE = 2  # 擷取/推論/繪製階段間的佇列容量（背壓）
+    PIPELINE_QUEUE_SIZE_MIN = 1  # 可調整範圍（依攝影機抖動程度建議 3-10）
+    PIPELINE_QUEUE_SIZE_MAX = 10
+    DATA_LOG_QUEUE_SIZE = 1024  # 背景資料記錄佇列容量
+    DATA_LOG_PUT_TIMEOUT_S = 0.5  # 佇列滿時管線等待的秒數，逾時才丟棄並計入 dropped_log_rows
+    DATA_LOG_BATCH_SIZE = 64  # 背景記錄線程每次最多寫入筆數
 
     # ========== 繪圖參數 ==========
     ANGLE_LINE_THICKNESS = 3
@@ -61,6 +71,7 @@ class ProcessingConfig:
     # ========== FPS 顯示 (OpenCV) ==========
     FPS_FONT_SCALE = 0.6
     FPS_FONT_THICKNESS = 2
+    FPS_EMA_ALPHA = 0.1  # FPS 平滑係數（越小越平滑）
 
     # ========== 字體路徑 ==========
     FONT_PATH = str(Path(__file__).parent / "Arial.Unicode.ttf")
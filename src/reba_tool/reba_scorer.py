@@ -29,10 +29,150 @@ Applied ergonomics, 31(2), 201-205.
 from typing import Dict, Optional, Tuple, List
 import logging
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """未安裝 numba 時退回純 Python"""
+        def decorator(func):
+            return func
+        return decorator
+
 # 設置日誌
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 角度陣列順序（_reba_kernel 的輸入）
+_ANGLE_KEYS = ('trunk', 'neck', 'leg', 'upper_arm', 'forearm', 'wrist')
+
+# 握持品質 → 分數（同 calculate_coupling_score）
+_COUPLING_SCORES = {'good': 0, 'fair': 1, 'poor': 2, 'unacceptable': 3}
+
+
+# ==================== REBA評分核心（可 JIT 編譯） ====================
+
+# 明確簽名：匯入時即編譯（cache=True 時直接載入磁碟快取），第一個影格不承擔編譯延遲。
+# 呼叫端須傳入 C 連續的 float64/int32 陣列，純量以 float()/bool() 轉型
+_REBA_KERNEL_SIGNATURE = (
+    "void(float64[::1], float64, int64, boolean, boolean, boolean, "
+    "int32[:, :, ::1], int32[:, :, ::1], int32[:, ::1], int32[::1])"
+)
+
+
+@njit(_REBA_KERNEL_SIGNATURE, cache=True)
+def _reba_kernel(angles, load_weight, coupling_score,
+                 is_static, is_repetitive, has_large_changes,
+                 table_a, table_b, table_c, out):
+    """
+    由六個關節角度一次算出全部 REBA 分數（純整數/浮點運算 + 查表）
+
+    判定規則與 score_* / calculate_* 方法（無扭轉、側彎等調整）一致，
+    修改評分標準時兩邊須同步。
+
+    Args:
+        angles: float64[6]，順序同 _ANGLE_KEYS
+        load_weight: 負荷重量（kg）
+        coupling_score: 握持分數 (0-3)
+        is_static, is_repetitive, has_large_changes: 活動調整因子
+        table_a, table_b, table_c: int32 評分表
+        out: int32[15] 輸出，順序同 REBAScorer.DETAIL_SCORE_KEYS
+    """
+    trunk_angle = angles[0]
+    neck_angle = angles[1]
+    leg_angle = angles[2]
+    upper_arm_angle = angles[3]
+    forearm_angle = angles[4]
+    wrist_angle = angles[5]
+
+    # 軀幹 (1-4)
+    if trunk_angle <= 5:
+        trunk = 1
+    elif trunk_angle <= 20:
+        trunk = 2
+    elif trunk_angle <= 60:
+        trunk = 3
+    else:
+        trunk = 4
+
+    # 頸部 (1-2)
+    neck = 1 if neck_angle <= 20 else 2
+
+    # 腿部 (1-4)：雙腳支撐
+    leg = 1 if leg_angle <= 30 else 2
+    if 30 <= leg_angle <= 60:
+        leg += 1
+    elif leg_angle > 60:
+        leg += 2
+    leg = min(leg, 4)
+
+    # 上臂 (1-4)
+    if upper_arm_angle <= 20:
+        upper_arm = 1
+    elif upper_arm_angle <= 45:
+        upper_arm = 2
+    elif upper_arm_angle <= 90:
+        upper_arm = 3
+    else:
+        upper_arm = 4
+
+    # 前臂 (1-2)
+    forearm = 1 if 60 <= forearm_angle <= 100 else 2
+
+    # 手腕 (1-2)
+    wrist = 1 if wrist_angle <= 15 else 2
+
+    # 表A / 表B（索引限制同 calculate_table_a / calculate_table_b）
+    posture_a = table_a[max(0, min(trunk - 1, 4)),
+                        max(0, min(neck - 1, 2)),
+                        max(0, min(leg - 1, 1))]
+    posture_b = table_b[max(0, min(upper_arm - 1, 5)),
+                        max(0, min(forearm - 1, 1)),
+                        max(0, min(wrist - 1, 2))]
+
+    # 負荷 (0-3)
+    if load_weight < 5:
+        load = 0
+    elif load_weight < 10:
+        load = 1
+    else:
+        load = 2
+    if is_static or is_repetitive:
+        load = max(load, 2)
+    load = min(load, 3)
+
+    score_a = posture_a + load
+    score_b = posture_b + coupling_score
+    score_c = table_c[max(0, min(score_a - 1, 11)), max(0, min(score_b - 1, 11))]
+
+    activity = 0
+    if is_static:
+        activity += 1
+    if is_repetitive:
+        activity += 1
+    if has_large_changes:
+        activity += 1
+
+    out[0] = neck
+    out[1] = trunk
+    out[2] = leg
+    out[3] = upper_arm
+    out[4] = forearm
+    out[5] = wrist
+    out[6] = posture_a
+    out[7] = posture_b
+    out[8] = load
+    out[9] = coupling_score
+    out[10] = score_a
+    out[11] = score_b
+    out[12] = score_c
+    out[13] = activity
+    out[14] = score_c + activity
+
 
 class REBAScorer:
     """
@@ -189,10 +329,28 @@ class REBAScorer:
                [11, 11, 11, 11, 12, 12, 12, 12, 12, 12, 12, 12],
                [12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12]]
 
+    # ==================== 詳細分數欄位 ====================
+
+    # calculate_reba_score 回傳之 details 中的分數欄位（固定順序，
+    # 供呼叫端以 operator.itemgetter 一次取出）。
+    # details 維持 dict：DataLogger、報告與 JSON 匯出直接以 dict 使用，
+    # 逐幀讀取的呼叫端改用 itemgetter 取值，不另建記錄類別
+    DETAIL_SCORE_KEYS = (
+        'neck_score', 'trunk_score', 'leg_score',
+        'upper_arm_score', 'forearm_score', 'wrist_score',
+        'posture_score_a', 'posture_score_b', 'load_score', 'coupling_score',
+        'score_a', 'score_b', 'score_c', 'activity_score', 'final_score',
+    )
 
-    
     def __init__(self):
         """初始化REBA評分器"""
+        # _reba_kernel 使用的陣列版評分表與重複使用的輸入/輸出緩衝區（型別須符合其簽名）
+        self._table_a = np.asarray(self.TABLE_A, dtype=np.int32)
+        self._table_b = np.asarray(self.TABLE_B, dtype=np.int32)
+        self._table_c = np.asarray(self.TABLE_C, dtype=np.int32)
+        self._angles_buf = np.zeros(len(_ANGLE_KEYS), dtype=np.float64)
+        self._scores_buf = np.zeros(len(self.DETAIL_SCORE_KEYS), dtype=np.int32)
+
         logger.info("REBA評分器初始化完成")
     
     # ==================== 身體部位評分方法 ====================
@@ -616,75 +774,31 @@ class REBAScorer:
             return False
         return True
 
-    def _score_body_parts(self, angles: Dict[str, Optional[float]]) -> Dict[str, int]:
-        """計算各身體部位分數"""
-        return {
-            'trunk': self.score_trunk(angles['trunk']),
-            'neck': self.score_neck(angles['neck']),
-            'leg': self.score_leg(angles['leg']),
-            'upper_arm': self.score_upper_arm(angles['upper_arm']),
-            'forearm': self.score_forearm(angles['forearm']),
-            'wrist': self.score_wrist(angles['wrist'])
-        }
-
-    def _calculate_group_a_score(self, scores: Dict[str, int], load_weight: float,
-                                 is_static: bool, is_repetitive: bool) -> Dict[str, int]:
-        """計算Group A分數（軀幹、頸部、腿部 + 負荷）"""
-        posture_score_a = self.calculate_table_a(scores['trunk'], scores['neck'], scores['leg'])
-        load_score = self.calculate_load_score(load_weight, is_static, is_repetitive)
-        return {
-            'posture_score_a': posture_score_a,
-            'load_score': load_score,
-            'score_a': posture_score_a + load_score
-        }
-
-    def _calculate_group_b_score(self, scores: Dict[str, int],
-                                 force_coupling: str) -> Dict[str, int]:
-        """計算Group B分數（上臂、前臂、手腕 + 握持）"""
-        posture_score_b = self.calculate_table_b(scores['upper_arm'], scores['forearm'], scores['wrist'])
-        coupling_score = self.calculate_coupling_score(force_coupling)
-        return {
-            'posture_score_b': posture_score_b,
-            'coupling_score': coupling_score,
-            'score_b': posture_score_b + coupling_score
-        }
-
-    def _calculate_final_score(self, score_a: int, score_b: int,
-                               is_static: bool, is_repetitive: bool,
-                               has_large_changes: bool) -> Dict[str, int]:
-        """計算最終分數（Table C + 活動）"""
-        score_c = self.calculate_table_c(score_a, score_b)
-        activity_score = self.calculate_activity_score(is_static, is_repetitive, has_large_changes)
-        return {
-            'score_c': score_c,
-            'activity_score': activity_score,
-            'final_score': score_c + activity_score
-        }
-
-    def _build_details_dict(self, body_scores: Dict[str, int],
-                           group_a: Dict[str, int], group_b: Dict[str, int],
-                           final: Dict[str, int], risk_level: str) -> Dict:
-        """構建詳細分數字典"""
+    def _build_details_dict(self, scores: List[int], risk_level: str) -> Dict:
+        """由 _reba_kernel 輸出（順序同 DETAIL_SCORE_KEYS）構建詳細分數字典"""
+        (neck, trunk, leg, upper_arm, forearm, wrist,
+         posture_a, posture_b, load, coupling,
+         score_a, score_b, score_c, activity, final) = scores
         return {
             # 各部位分數
-            'trunk_score': body_scores['trunk'],
-            'neck_score': body_scores['neck'],
-            'leg_score': body_scores['leg'],
-            'upper_arm_score': body_scores['upper_arm'],
-            'forearm_score': body_scores['forearm'],
-            'wrist_score': body_scores['wrist'],
+            'trunk_score': trunk,
+            'neck_score': neck,
+            'leg_score': leg,
+            'upper_arm_score': upper_arm,
+            'forearm_score': forearm,
+            'wrist_score': wrist,
             # 表格分數
-            'posture_score_a': group_a['posture_score_a'],
-            'load_score': group_a['load_score'],
-            'score_a': group_a['score_a'],
-            'posture_score_b': group_b['posture_score_b'],
-            'coupling_score': group_b['coupling_score'],
-            'score_b': group_b['score_b'],
-            'score_c': final['score_c'],
+            'posture_score_a': posture_a,
+            'load_score': load,
+            'score_a': score_a,
+            'posture_score_b': posture_b,
+            'coupling_score': coupling,
+            'score_b': score_b,
+            'score_c': score_c,
             # 調整分數
-            'activity_score': final['activity_score'],
+            'activity_score': activity,
             # 最終結果
-            'final_score': final['final_score'],
+            'final_score': final,
             'risk_level': risk_level
         }
 
@@ -695,7 +809,7 @@ class REBAScorer:
                             is_repetitive: bool = False,
                             has_large_changes: bool = False) -> Tuple[int, str, Dict]:
         """
-        計算完整REBA分數（重構為pipeline模式）
+        計算完整REBA分數（單次呼叫 _reba_kernel 完成全部評分與查表）
 
         Args:
             angles: 各關節角度字典，包含：
@@ -718,16 +832,23 @@ class REBAScorer:
             return 0, 'unknown', {}
 
         try:
-            body_scores = self._score_body_parts(angles)
-            group_a = self._calculate_group_a_score(body_scores, load_weight, is_static, is_repetitive)
-            group_b = self._calculate_group_b_score(body_scores, force_coupling)
-            final = self._calculate_final_score(group_a['score_a'], group_b['score_b'],
-                                               is_static, is_repetitive, has_large_changes)
-            risk_level = self.get_risk_level(final['final_score'])
-            details = self._build_details_dict(body_scores, group_a, group_b, final, risk_level)
-
-            # logger.info(f"REBA計算完成: 分數={final['final_score']}, 風險等級={risk_level} , group_b={group_b}")
-            return final['final_score'], risk_level, details
+            angles_buf = self._angles_buf
+            for i, key in enumerate(_ANGLE_KEYS):
+                angles_buf[i] = angles[key]
+            coupling_score = _COUPLING_SCORES.get(force_coupling.lower(), 0)
+
+            _reba_kernel(angles_buf, float(load_weight), coupling_score,
+                         bool(is_static), bool(is_repetitive), bool(has_large_changes),
+                         self._table_a, self._table_b, self._table_c,
+                         self._scores_buf)
+
+            # tolist() 轉回 Python int，details 可直接序列化為 JSON
+            scores = self._scores_buf.tolist()
+            final_score = scores[-1]
+            risk_level = self.get_risk_level(final_score)
+            details = self._build_details_dict(scores, risk_level)
+
+            return final_score, risk_level, details
 
         except Exception as e:
             logger.error(f"REBA計算錯誤: {e}")
@@ -4,18 +4,18 @@
 純 UI 呈現層，所有業務邏輯委派給 VideoController。
 """
 
-import cv2
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout,
                                 QHBoxLayout, QPushButton, QLabel, QFileDialog,
-                                QGroupBox, QGridLayout, QTextEdit,
+                                QGroupBox, QGridLayout, QPlainTextEdit,
                                 QComboBox, QDoubleSpinBox, QSlider, QCheckBox,
                                 QTableWidget, QTableWidgetItem, QHeaderView,
                                 QAbstractItemView, QApplication)
-from PySide6.QtCore import Qt, QTimer, Signal, QEvent
-from PySide6.QtGui import QImage, QPixmap, QColor, QBrush
+from PySide6.QtCore import Qt, QTimer, Signal, QSignalBlocker
+from PySide6.QtGui import QImage, QPixmap, QColor, QBrush, QShortcut, QKeySequence
 
 from ui.qt_config import QtConfig
 from ui.video_worker import VideoWorker
@@ -23,6 +23,39 @@ from ui.table_c_dialog import TableCDialog
 from video_controller import VideoController
 
 
+def _ensure_suffix(file_path: str, suffix: str) -> str:
+    """確保路徑以指定副檔名結尾（不分大小寫），否則附加"""
+    p = Path(file_path)
+    if p.suffix.lower() != suffix:
+        p = p.with_name(p.name + suffix)
+    return str(p)
+
+
+# 握持品質顯示名稱
+_COUPLING_LABELS = {"good": "\u826f\u597d", "fair": "\u666e\u901a", "poor": "\u5dee", "unacceptable": "\u4e0d\u53ef\u63a5\u53d7"}
+
+# 複製報告時插入的參數設定區塊
+_PARAM_SECTION_TEMPLATE = """\u5206\u6790\u6642\u9593: {timestamp}
+
+\u3010\u8a55\u4f30\u53c3\u6578\u8a2d\u5b9a\u3011
+\u251c\u2500 \u5206\u6790\u5074: {side}
+\u251c\u2500 \u8ca0\u91cd: {load_weight} kg
+\u2514\u2500 \u63e1\u6301\u54c1\u8cea: {coupling_text}
+
+"""
+
+
+def _splice_param_section(text: str, param_section: str) -> str:
+    """在報告標題（前 3 行）之後插入參數設定區塊"""
+    # 找到第 3 個換行直接切片插入，不拆成逐行 list
+    idx = -1
+    for _ in range(3):
+        idx = text.find('\n', idx + 1)
+        if idx < 0:
+            return text + '\n' + param_section
+    return text[:idx + 1] + param_section + text[idx + 1:]
+
+
 class MainWindow(QMainWindow):
     """主視窗 - 純 UI 呈現"""
 
@@ -40,16 +73,47 @@ class MainWindow(QMainWindow):
         # QThread worker
         self.video_worker = None
 
+        # 剪貼簿（單例，只取一次）
+        self._clipboard = QApplication.clipboard()
+
         # UI 狀態
         self.is_slider_dragging = False
         self.pending_seek_frame = -1
         self.was_paused_before_drag = False
 
-        # 節流計時器
-        self.slider_throttle_timer = QTimer()
+        # 拖曳跳轉防抖計時器
+        self.slider_throttle_timer = QTimer(self)
         self.slider_throttle_timer.setSingleShot(True)
         self.slider_throttle_timer.timeout.connect(self._execute_throttled_seek)
 
+        # 進度更新合併計時器（每幀只記錄最新值，定時刷新 UI）
+        self._pending_progress = None
+        self._last_total_frames = -1
+        self._time_strings = []
+        self._fps = QtConfig.DEFAULT_VIDEO_FPS
+        self._seconds_per_frame = 1.0 / self._fps
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # 最新幀輪詢計時器（取代逐幀跨線程 Signal）
+        self._frame_poll_timer = QTimer(self)
+        self._frame_poll_timer.setInterval(QtConfig.FRAME_POLL_INTERVAL_MS)
+        self._frame_poll_timer.timeout.connect(self._poll_latest_frame)
+
+        # 視窗縮放合併計時器（連續縮放只重算一次欄寬）
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(QtConfig.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._update_table_column_widths)
+
+        # 日誌合併計時器（訊息先進佇列，定時一次寫入）
+        self._log_queue = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(QtConfig.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
         # 初始化 UI
         self.init_ui()
 
@@ -192,9 +256,10 @@ class MainWindow(QMainWindow):
         self.label_record_count.setFont(stats_font)
         stats_layout.addWidget(self.label_record_count, 2, 1)
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setFont(cfg.get_log_text_font())
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(cfg.LOG_MAX_LINES)
         self.log_text.setMaximumHeight(cfg.LOG_TEXT_MAX_HEIGHT)
         log_layout.addWidget(self.log_text)
 
@@ -267,7 +332,9 @@ class MainWindow(QMainWindow):
         self.angle_table = QTableWidget()
         self.angle_table.setColumnCount(5)
         self.angle_table.setFont(cfg.get_formula_detail_font())
-        self.angle_table.installEventFilter(self)
+        self._copy_shortcut = QShortcut(QKeySequence.Copy, self.angle_table)
+        self._copy_shortcut.setContext(Qt.WidgetShortcut)
+        self._copy_shortcut.activated.connect(self._copy_table_selection)
 
         self.table_structure = [
             ('部位', '', '角度', '', True, False),
@@ -448,7 +515,16 @@ class MainWindow(QMainWindow):
 
     def log(self, message: str):
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        self._log_queue.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_queue:
+            return
+        batch = '\n'.join(self._log_queue)
+        self._log_queue.clear()
+        self.log_text.appendPlainText(batch)
 
     # ========== 控制方法 ==========
 
@@ -479,14 +555,16 @@ class MainWindow(QMainWindow):
         show_values = self.check_angle_values.isChecked()
 
         self.controller.start(video_source, side, load_weight, force_coupling, show_lines, show_values)
+        self._last_total_frames = -1
 
         # 建立 QThread worker
-        self.video_worker = VideoWorker(self.controller.pipeline, self.controller.event_bus)
-        self.video_worker.frame_ready.connect(self.update_display)
+        self.video_worker = VideoWorker(self.controller.pipeline, self.controller.event_bus,
+                                        latest_only=True)
         self.video_worker.finished_signal.connect(self.processing_finished)
         self.video_worker.error_signal.connect(self.handle_error)
         self.video_worker.progress_signal.connect(self.update_progress)
         self.video_worker.start()
+        self._frame_poll_timer.start()
 
         # 更新 UI 狀態
         self.btn_camera.setEnabled(False)
@@ -529,6 +607,8 @@ class MainWindow(QMainWindow):
         self.processing_finished()
 
     def processing_finished(self):
+        self._poll_latest_frame()
+        self._frame_poll_timer.stop()
         self.controller.on_processing_finished()
         self.btn_camera.setEnabled(True)
         self.btn_video.setEnabled(True)
@@ -538,6 +618,8 @@ class MainWindow(QMainWindow):
         self.progress_slider.setEnabled(False)
 
         self.log(f"\u8655\u7406\u5b8c\u6210\uff0c\u5171\u8655\u7406 {self.controller.frame_count} \u5e40")
+        if self.controller.dropped_log_rows:
+            self.log(f"\u8b66\u544a: {self.controller.dropped_log_rows} \u5e40\u56e0\u8a18\u9304\u4f47\u5217\u5df2\u6eff\u800c\u672a\u5beb\u5165\u8cc7\u6599\u8a18\u9304")
         self.statusBar().showMessage("\u8655\u7406\u5b8c\u6210")
 
     def handle_error(self, error_msg: str):
@@ -547,8 +629,15 @@ class MainWindow(QMainWindow):
 
     # ========== 顯示更新 ==========
 
+    def _poll_latest_frame(self):
+        if self.video_worker is None:
+            return
+        latest = self.video_worker.pop_latest()
+        if latest is not None:
+            self.update_display(*latest)
+
     def update_display(self, frame, angles, reba_score, risk_level, fps, details):
-        # 委派給 controller 記錄資料
+        # 更新 controller 的鎖定資料（逐幀計數與記錄已在管線線程完成，不受輪詢合併影響）
         self.controller.record_frame(frame, angles, reba_score, risk_level, fps, details)
 
         self.label_frame_count.setText(str(self.controller.frame_count))
@@ -556,10 +645,10 @@ class MainWindow(QMainWindow):
 
         if not self.controller.data_locked:
             # 更新影像
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame_rgb.shape
+            # 直接以 BGR888 包裝 OpenCV 幀，省去一次全幀色彩轉換
+            h, w, ch = frame.shape
             bytes_per_line = ch * w
-            qt_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_BGR888)
             scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
                 self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
             )
@@ -714,27 +803,17 @@ class MainWindow(QMainWindow):
         side = self.combo_side.currentText()
         load_weight = self.spin_load.value()
         coupling = self.combo_coupling.currentText()
-        coupling_labels = {"good": "\u826f\u597d", "fair": "\u666e\u901a", "poor": "\u5dee", "unacceptable": "\u4e0d\u53ef\u63a5\u53d7"}
-        coupling_text = coupling_labels.get(coupling, coupling)
+        coupling_text = _COUPLING_LABELS.get(coupling, coupling)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # 在報告開頭插入參數設定
-        param_section = f"""\u5206\u6790\u6642\u9593: {timestamp}
-
-\u3010\u8a55\u4f30\u53c3\u6578\u8a2d\u5b9a\u3011
-\u251c\u2500 \u5206\u6790\u5074: {side}
-\u251c\u2500 \u8ca0\u91cd: {load_weight} kg
-\u2514\u2500 \u63e1\u6301\u54c1\u8cea: {coupling_text}
+        param_section = _PARAM_SECTION_TEMPLATE.format(
+            timestamp=timestamp, side=side,
+            load_weight=load_weight, coupling_text=coupling_text
+        )
+        final_text = _splice_param_section(text, param_section)
 
-"""
-        # 找到第一個換行後插入參數
-        lines = text.split('\n')
-        # 插入到標題行之後
-        insert_idx = 3  # 在第3行之後
-        final_text = '\n'.join(lines[:insert_idx]) + '\n' + param_section + '\n'.join(lines[insert_idx:])
-
-        clipboard = QApplication.clipboard()
-        clipboard.setText(final_text)
+        self._clipboard.setText(final_text)
         self.log("\u8cc7\u6599\u5df2\u8907\u88fd\u5230\u526a\u8cbc\u7c3f")
         self.statusBar().showMessage("\u8cc7\u6599\u5df2\u8907\u88fd", 2000)
 
@@ -748,9 +827,7 @@ class MainWindow(QMainWindow):
             "CSV\u6a94\u6848 (*.csv)"
         )
         if file_path:
-            if not file_path.endswith('.csv'):
-                file_path += '.csv'
-            saved_path = self.controller.save_csv(file_path)
+            saved_path = self.controller.save_csv(_ensure_suffix(file_path, '.csv'))
             self.log(f"\u5df2\u4fdd\u5b58CSV: {Path(saved_path).name}")
 
     def save_json(self):
@@ -763,25 +840,49 @@ class MainWindow(QMainWindow):
             "JSON\u6a94\u6848 (*.json)"
         )
         if file_path:
-            if not file_path.endswith('.json'):
-                file_path += '.json'
-            saved_path = self.controller.save_json(file_path)
+            saved_path = self.controller.save_json(_ensure_suffix(file_path, '.json'))
             self.log(f"\u5df2\u4fdd\u5b58JSON: {Path(saved_path).name}")
 
     # ========== 進度條操作 ==========
 
     def update_progress(self, current_frame: int, total_frames: int):
-        if total_frames > 0:
-            self.progress_slider.blockSignals(True)
-            self.progress_slider.setMaximum(total_frames)
-            self.progress_slider.setValue(current_frame)
-            self.progress_slider.blockSignals(False)
+        self._pending_progress = (current_frame, total_frames)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start(QtConfig.PROGRESS_UPDATE_INTERVAL_MS)
+
+    def _flush_progress(self):
+        if self._pending_progress is None:
+            return
+        current_frame, total_frames = self._pending_progress
+        self._pending_progress = None
 
-            fps = 30.0
-            current_seconds = int(current_frame / fps)
-            total_seconds = int(total_frames / fps)
-            self.label_time_current.setText(f"{current_seconds // 60:02d}:{current_seconds % 60:02d}")
-            self.label_time_total.setText(f"{total_seconds // 60:02d}:{total_seconds % 60:02d}")
+        if total_frames > 0:
+            # 總幀數只在載入新影片時改變，避免每次都重設範圍
+            if total_frames != self._last_total_frames:
+                self._last_total_frames = total_frames
+                with QSignalBlocker(self.progress_slider):
+                    self.progress_slider.setMaximum(total_frames)
+                pipeline = self.controller.pipeline
+                self._fps = float((pipeline and pipeline.fps) or QtConfig.DEFAULT_VIDEO_FPS)
+                self._seconds_per_frame = 1.0 / self._fps
+                self._build_time_strings(total_frames)
+                self.label_time_total.setText(self._format_frame_time(total_frames))
+
+            with QSignalBlocker(self.progress_slider):
+                self.progress_slider.setValue(current_frame)
+            self.label_time_current.setText(self._format_frame_time(current_frame))
+
+    def _build_time_strings(self, total_frames: int):
+        """預先建立每秒對應的 MM:SS 字串表（每次載入影片建立一次）"""
+        max_seconds = int(total_frames * self._seconds_per_frame)
+        self._time_strings = [f"{s // 60:02d}:{s % 60:02d}" for s in range(max_seconds + 1)]
+
+    def _format_frame_time(self, frame: int) -> str:
+        """幀號轉 MM:SS，優先查表，超出範圍時退回即時格式化"""
+        seconds = int(frame * self._seconds_per_frame)
+        if 0 <= seconds < len(self._time_strings):
+            return self._time_strings[seconds]
+        return f"{seconds // 60:02d}:{seconds % 60:02d}"
 
     def slider_pressed(self):
         self.is_slider_dragging = True
@@ -798,12 +899,10 @@ class MainWindow(QMainWindow):
 
         pipeline = self.controller.pipeline
         if pipeline and pipeline.total_frames > 0:
-            fps = 30.0
-            current_seconds = int(value / fps)
-            self.label_time_current.setText(f"{current_seconds // 60:02d}:{current_seconds % 60:02d}")
+            self.label_time_current.setText(self._format_frame_time(value))
 
-        if not self.slider_throttle_timer.isActive():
-            self.slider_throttle_timer.start(QtConfig.SLIDER_DRAG_THROTTLE_MS)
+        # 每次移動都重新計時，只在拖曳停頓後以最後位置跳轉
+        self.slider_throttle_timer.start(QtConfig.SLIDER_DRAG_THROTTLE_MS)
 
     def _execute_throttled_seek(self):
         if self.pending_seek_frame >= 0:
@@ -843,46 +942,38 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._update_table_column_widths()
-
-    def eventFilter(self, obj, event):
-        if obj == self.angle_table and event.type() == QEvent.KeyPress:
-            if event.modifiers() == Qt.ControlModifier and event.key() == Qt.Key_C:
-                self._copy_table_selection()
-                return True
-        return super().eventFilter(obj, event)
+        self._resize_timer.start()
 
     def _copy_table_selection(self):
         selection = self.angle_table.selectedRanges()
         if not selection:
             return
 
-        rows_data = {}
+        # 以選取範圍的外框配置密集二維陣列，避免逐格 dict 雜湊
+        top = min(r.topRow() for r in selection)
+        bottom = max(r.bottomRow() for r in selection)
+        left = min(r.leftColumn() for r in selection)
+        right = max(r.rightColumn() for r in selection)
+        ncols = right - left + 1
+        grid = [[''] * ncols for _ in range(bottom - top + 1)]
+
+        table = self.angle_table
         for sel_range in selection:
+            c0 = sel_range.leftColumn()
+            c1 = sel_range.rightColumn() + 1
             for row in range(sel_range.topRow(), sel_range.bottomRow() + 1):
-                if row not in rows_data:
-                    rows_data[row] = {}
-                for col in range(sel_range.leftColumn(), sel_range.rightColumn() + 1):
-                    item = self.angle_table.item(row, col)
-                    text = item.text() if item else ''
-                    rows_data[row][col] = text
-
-        lines = []
-        for row in sorted(rows_data.keys()):
-            cols = rows_data[row]
-            min_col = min(cols.keys())
-            max_col = max(cols.keys())
-            row_texts = []
-            for col in range(min_col, max_col + 1):
-                row_texts.append(cols.get(col, ''))
-            lines.append('\t'.join(row_texts))
-
-        clipboard = QApplication.clipboard()
-        clipboard.setText('\n'.join(lines))
+                grid_row = grid[row - top]
+                for col in range(c0, c1):
+                    item = table.item(row, col)
+                    if item:
+                        grid_row[col - left] = item.text()
+
+        self._clipboard.setText('\n'.join('\t'.join(grid_row) for grid_row in grid))
 
     def closeEvent(self, event):
         if self.video_worker and self.video_worker.isRunning():
             self.controller.stop()
             self.video_worker.wait()
             self.video_worker.cleanup()
+        self.controller.close_models()
         event.accept()
@@ -72,6 +72,7 @@ class QtConfig:
     TABLE_ROW_HEIGHT = 28
     TABLE_HEADER_HEIGHT = 32
     TABLE_COLUMN_RATIOS = [3, 2, 1, 3, 2]
+    RESIZE_DEBOUNCE_MS = 50  # 視窗縮放後重算欄寬的延遲
 
     # --- 統計資訊字體 ---
     STATS_FONT_SIZE = 24
@@ -91,9 +92,16 @@ class QtConfig:
 
     # ========== 元件尺寸 ==========
     LOG_TEXT_MAX_HEIGHT = 150
+    LOG_MAX_LINES = 1000  # 日誌框保留行數上限
+    LOG_FLUSH_INTERVAL_MS = 100  # 日誌批次寫入間隔
+
+    # ========== 畫面更新設定 ==========
+    FRAME_POLL_INTERVAL_MS = 33  # GUI 取用最新幀的間隔（約 30 Hz）
 
     # ========== 進度條拖曳設定 ==========
     SLIDER_DRAG_THROTTLE_MS = 150
+    DEFAULT_VIDEO_FPS = 30.0  # 無法取得影片幀率時的預設值
+    PROGRESS_UPDATE_INTERVAL_MS = 100  # 進度條/時間標籤最高 10 Hz 更新
 
     # ========== 字體取得方法 ==========
 
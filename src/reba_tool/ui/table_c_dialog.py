@@ -6,20 +6,141 @@ Table C 對話框 (Table C Dialog)
 """
 
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-                                QPushButton, QTableWidget, QTableWidgetItem,
-                                QHeaderView)
-from PySide6.QtCore import Qt
+                                QPushButton, QTableView, QHeaderView)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont, QColor
 
 from reba_scorer import REBAScorer
 
 
+def _score_color(score):
+    """根據分數取得對應顏色"""
+    if score == 1:
+        return "#78c850"
+    elif score <= 3:
+        return "#a8d08d"
+    elif score <= 7:
+        return "#ffeb3b"
+    elif score <= 10:
+        return "#ff9800"
+    else:
+        return "#f44336"
+
+
+# 預先建立的顏色（data() 每次查詢直接回傳，不逐格建構 QColor）
+_HEADER_BG = QColor('#d0d0d0')
+_HEADER_HIGHLIGHT_BG = QColor('#4a90d9')
+_LIGHT_HIGHLIGHT_BG = QColor('#b3d9ff')
+_TARGET_BG = QColor('#1565c0')
+_WHITE = QColor('white')
+_BLACK = QColor('black')
+# 以分數 (1-12) 為索引，索引 0 不使用
+_SCORE_QCOLORS = tuple(QColor(_score_color(max(score, 1))) for score in range(13))
+
+
+class TableCModel(QAbstractTableModel):
+    """唯讀 Table C 模型 (13x13，含標題列/欄)，不建立任何 QTableWidgetItem"""
+
+    TABLE_C_DATA = REBAScorer.TABLE_C
+
+    def __init__(self, score_a=None, score_b=None, parent=None):
+        super().__init__(parent)
+        self._score_a = None
+        self._score_b = None
+        self._set_scores(score_a, score_b)
+
+        self._font = QFont("Microsoft JhengHei", 10)
+        self._bold_font = QFont("Microsoft JhengHei", 10, QFont.Bold)
+        self._target_font = QFont("Microsoft JhengHei", 14, QFont.Bold)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 13  # 1 header + 12 data
+
+    def columnCount(self, parent=QModelIndex()):
+        return 13  # 1 header + 12 data
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if row == 0 and col == 0:
+                return "Score A \\ B"
+            if row == 0:
+                return str(col)
+            if col == 0:
+                return str(row)
+            return str(self.TABLE_C_DATA[row - 1][col - 1])
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        is_header = (row == 0 or col == 0)
+        in_row = (row == self._score_a)
+        in_col = (col == self._score_b)
+
+        if role == Qt.BackgroundRole:
+            if in_row and in_col:
+                return _TARGET_BG
+            if in_row or in_col:
+                return _HEADER_HIGHLIGHT_BG if is_header else _LIGHT_HIGHLIGHT_BG
+            if is_header:
+                return _HEADER_BG
+            return self._get_score_qcolor(self.TABLE_C_DATA[row - 1][col - 1])
+
+        if role == Qt.ForegroundRole:
+            if (in_row and in_col) or (is_header and (in_row or in_col)):
+                return _WHITE
+            return _BLACK
+
+        if role == Qt.FontRole:
+            if in_row and in_col:
+                return self._target_font
+            if is_header or in_row or in_col:
+                return self._bold_font
+            return self._font
+
+        return None
+
+    @staticmethod
+    def _get_score_qcolor(score):
+        """根據分數取得預先建立的 QColor"""
+        return _SCORE_QCOLORS[max(1, min(12, score))]
+
+    def _set_scores(self, score_a, score_b):
+        if score_a is None or score_b is None:
+            self._score_a = None
+            self._score_b = None
+        else:
+            self._score_a = max(1, min(12, score_a))
+            self._score_b = max(1, min(12, score_b))
+
+    def set_highlight(self, score_a, score_b):
+        """更新強調位置，只對新舊的行/欄發出 dataChanged"""
+        old_a, old_b = self._score_a, self._score_b
+        self._set_scores(score_a, score_b)
+        if (old_a, old_b) == (self._score_a, self._score_b):
+            return
+
+        roles = [Qt.BackgroundRole, Qt.ForegroundRole, Qt.FontRole]
+        last = 12
+        for row in {old_a, self._score_a} - {None}:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last), roles)
+        for col in {old_b, self._score_b} - {None}:
+            self.dataChanged.emit(self.index(0, col), self.index(last, col), roles)
+
+
 class TableCDialog(QDialog):
     """Table C 對話框 - 顯示 REBA Score A 與 Score B 的對照表"""
 
     # 直接使用 REBAScorer 的 TABLE_C
     TABLE_C_DATA = REBAScorer.TABLE_C
 
+    MIN_SECTION_SIZE = 40
+
     def __init__(self, parent=None, score_a=None, score_b=None):
         super().__init__(parent)
         self.score_a = score_a
@@ -40,48 +161,21 @@ class TableCDialog(QDialog):
         layout.addWidget(title_label)
 
         # 建立表格 (13行 x 13列，包含標題)
-        self.table = QTableWidget(13, 13)
+        self.model = TableCModel(self.score_a, self.score_b, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setFont(QFont("Microsoft JhengHei", 10))
         layout.addWidget(self.table)
 
-        # 設定標題
-        self.table.setHorizontalHeaderLabels(['Score B \u2192'] + [str(i) for i in range(1, 13)])
-        self.table.setVerticalHeaderLabels(['Score A \u2193'] + [str(i) for i in range(1, 13)])
-
-        # 填入第一行（Score B 標題）
-        for col in range(13):
-            if col == 0:
-                item = QTableWidgetItem("Score A \\ B")
-            else:
-                item = QTableWidgetItem(str(col))
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setBackground(QColor('#d0d0d0'))
-            item.setFont(QFont("Microsoft JhengHei", 10, QFont.Bold))
-            self.table.setItem(0, col, item)
-
-        # 填入第一欄（Score A 標題）和資料
-        for row in range(1, 13):
-            header_item = QTableWidgetItem(str(row))
-            header_item.setTextAlignment(Qt.AlignCenter)
-            header_item.setBackground(QColor('#d0d0d0'))
-            header_item.setFont(QFont("Microsoft JhengHei", 10, QFont.Bold))
-            self.table.setItem(row, 0, header_item)
-
-            for col in range(1, 13):
-                value = self.TABLE_C_DATA[row - 1][col - 1]
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                color = self._get_score_color(value)
-                item.setBackground(QColor(color))
-                self.table.setItem(row, col, item)
-
-        if self.score_a is not None and self.score_b is not None:
-            self._highlight_current_score()
-
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.horizontalHeader().setVisible(False)
-        self.table.verticalHeader().setVisible(False)
+        # 固定 13x13 表格：依內容計算一次尺寸即可，不需每次縮放重排
+        # 最小尺寸保留空間給強調後放大的交叉點字體
+        for header in (self.table.horizontalHeader(), self.table.verticalHeader()):
+            header.setMinimumSectionSize(self.MIN_SECTION_SIZE)
+            header.setVisible(False)
+        self.table.resizeColumnsToContents()
+        self.table.resizeRowsToContents()
+        for header in (self.table.horizontalHeader(), self.table.verticalHeader()):
+            header.setSectionResizeMode(QHeaderView.Fixed)
 
         # 圖例
         legend_layout = QHBoxLayout()
@@ -108,88 +202,8 @@ class TableCDialog(QDialog):
         btn_close.clicked.connect(self.close)
         layout.addWidget(btn_close)
 
-    def _get_score_color(self, score):
-        """根據分數取得對應顏色"""
-        if score == 1:
-            return "#78c850"
-        elif score <= 3:
-            return "#a8d08d"
-        elif score <= 7:
-            return "#ffeb3b"
-        elif score <= 10:
-            return "#ff9800"
-        else:
-            return "#f44336"
-
-    def _highlight_current_score(self):
-        """強調當前 Score A / Score B 對應的儲存格"""
-        if self.score_a is None or self.score_b is None:
-            return
-
-        score_a = max(1, min(12, self.score_a))
-        score_b = max(1, min(12, self.score_b))
-
-        light_highlight = QColor('#b3d9ff')
-        header_highlight = QColor('#4a90d9')
-
-        # 強調整行
-        for col in range(13):
-            item = self.table.item(score_a, col)
-            if item:
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-                if col == 0:
-                    item.setBackground(header_highlight)
-                    item.setForeground(QColor('white'))
-                else:
-                    item.setBackground(light_highlight)
-
-        # 強調整欄
-        for row in range(13):
-            item = self.table.item(row, score_b)
-            if item:
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-                if row == 0:
-                    item.setBackground(header_highlight)
-                    item.setForeground(QColor('white'))
-                elif row != score_a:
-                    item.setBackground(light_highlight)
-
-        # 交叉點
-        target_item = self.table.item(score_a, score_b)
-        if target_item:
-            target_item.setBackground(QColor('#1565c0'))
-            target_item.setForeground(QColor('white'))
-            font = target_item.font()
-            font.setBold(True)
-            font.setPointSize(14)
-            target_item.setFont(font)
-
     def update_scores(self, score_a, score_b):
         """更新分數並重新強調"""
         self.score_a = score_a
         self.score_b = score_b
-
-        # 重設所有儲存格樣式
-        for row in range(13):
-            for col in range(13):
-                item = self.table.item(row, col)
-                if item:
-                    font = item.font()
-                    font.setBold(False)
-                    font.setPointSize(10)
-                    item.setFont(font)
-                    item.setForeground(QColor('black'))
-
-                    if row == 0 or col == 0:
-                        item.setBackground(QColor('#d0d0d0'))
-                        font.setBold(True)
-                        item.setFont(font)
-                    elif row > 0 and col > 0:
-                        value = self.TABLE_C_DATA[row - 1][col - 1]
-                        item.setBackground(QColor(self._get_score_color(value)))
-
-        self._highlight_current_score()
+        self.model.set_highlight(score_a, score_b)
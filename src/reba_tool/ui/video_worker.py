@@ -5,7 +5,9 @@ QThread 橋接 (Video Worker)
 將 EventBus callback 轉為 Qt Signal（自動跨線程到主線程）。
 """
 
-from PySide6.QtCore import QThread, Signal
+import threading
+
+from PySide6.QtCore import QThread, Signal, QMutex, QMutexLocker
 
 from event_bus import EventBus
 from video_pipeline import VideoPipeline
@@ -20,11 +22,31 @@ class VideoWorker(QThread):
     error_signal = Signal(str)
     progress_signal = Signal(int, int)
 
-    def __init__(self, pipeline: VideoPipeline, event_bus: EventBus):
+    def __init__(self, pipeline: VideoPipeline, event_bus: EventBus,
+                 latest_only: bool = False, drop_if_busy: bool = False):
+        """
+        Args:
+            pipeline: 影片處理管線
+            event_bus: 事件匯流排
+            latest_only: True 時不逐幀發送 frame_ready，
+                只保留最新一幀，由 GUI 端計時器呼叫 pop_latest() 取用
+                （只合併顯示；資料記錄由 VideoController 逐幀完成）
+            drop_if_busy: True 時上一幀尚未被 GUI 處理完（未呼叫
+                frame_consumed()）就丟棄新幀，不讓跨線程事件堆積
+        """
         super().__init__()
         self._pipeline = pipeline
         self._event_bus = event_bus
 
+        # 單槽最新幀緩衝（latest_only 模式）
+        self._latest_only = latest_only
+        self._latest = None
+        self._lock = QMutex()
+
+        # 在途幀旗標（drop_if_busy 模式）：發送時設定，GUI 處理完清除
+        self._drop_if_busy = drop_if_busy
+        self._inflight = threading.Event()
+
         # 註冊 EventBus 回調 → 轉為 Qt Signal
         self._event_bus.on('frame_processed', self._on_frame_processed)
         self._event_bus.on('processing_finished', self._on_finished)
@@ -42,9 +64,34 @@ class VideoWorker(QThread):
         self._event_bus.off('error_occurred', self._on_error)
         self._event_bus.off('progress_updated', self._on_progress)
 
+    def pop_latest(self):
+        """
+        取出並清除最新一幀（latest_only 模式，於 GUI 線程呼叫）
+
+        Returns:
+            (frame, angles, reba_score, risk_level, fps, details) 或 None
+        """
+        with QMutexLocker(self._lock):
+            latest = self._latest
+            self._latest = None
+        return latest
+
+    def frame_consumed(self):
+        """GUI 處理完 frame_ready 後呼叫（drop_if_busy 模式）"""
+        self._inflight.clear()
+
     # ========== EventBus → Qt Signal 橋接 ==========
 
     def _on_frame_processed(self, frame, angles, reba_score, risk_level, fps, details):
+        if self._latest_only:
+            # 覆寫舊幀：GUI 來不及處理的幀直接丟棄，不累積跨線程事件
+            with QMutexLocker(self._lock):
+                self._latest = (frame, angles, reba_score, risk_level, fps, details)
+            return
+        if self._drop_if_busy:
+            if self._inflight.is_set():
+                return  # GUI 尚在處理上一幀，丟棄此幀
+            self._inflight.set()
         self.frame_ready.emit(frame, angles, reba_score, risk_level, fps, details)
 
     def _on_finished(self):
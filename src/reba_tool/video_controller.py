@@ -5,7 +5,10 @@ UI 層唯一需要互動的對象，零 Qt 依賴。
 協調 EventBus, ProcessingConfig, VideoPipeline, DataLogger。
 """
 
-from datetime import datetime
+import queue
+import threading
+import time
+import traceback
 from typing import Optional
 from pathlib import Path
 
@@ -16,20 +19,114 @@ from data_logger import DataLogger
 from reba_scorer import REBAScorer
 
 
+_RISK_LABELS = {
+    'negligible': '可忽略',
+    'low': '低風險',
+    'medium': '中等風險',
+    'high': '高風險',
+    'very_high': '極高風險'
+}
+
+# risk_level → (顯示標籤, 風險描述)，首次查詢時填入
+_RISK_CACHE = {}
+
+# 報告中直接取自 details 的欄位（缺值顯示 "--"）
+_COPY_DETAIL_KEYS = (
+    'neck_score',
+    'trunk_score',
+    'upper_arm_score',
+    'forearm_score',
+    'wrist_score',
+    'leg_score',
+    'posture_score_a',
+    'load_score',
+    'score_a',
+    'posture_score_b',
+    'coupling_score',
+    'score_b',
+    'score_c',
+    'activity_score',
+    'final_score',
+)
+
+# 剪貼簿報告模板：框線與標籤固定，只有數值欄位逐次填入
+_COPY_TEMPLATE = """\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
+          REBA \u4eba\u56e0\u5de5\u7a0b\u5206\u6790\u5831\u544a
+\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
+\u5206\u6790\u6642\u9593: {timestamp}
+
+\u3010\u95dc\u7bc0\u89d2\u5ea6\u6e2c\u91cf\u5024\u3011
+\u250c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
+\u2502 \u90e8\u4f4d   \u2502 \u89d2\u5ea6     \u2502 \u5206\u6578   \u2502
+\u251c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2524
+\u2502 \u9838\u90e8   \u2502 {neck_angle:>8} \u2502 {neck_score:>6} \u2502
+\u2502 \u8ec0\u5e79   \u2502 {trunk_angle:>8} \u2502 {trunk_score:>6} \u2502
+\u2502 \u4e0a\u81c2   \u2502 {upper_arm_angle:>8} \u2502 {upper_arm_score:>6} \u2502
+\u2502 \u524d\u81c2   \u2502 {forearm_angle:>8} \u2502 {forearm_score:>6} \u2502
+\u2502 \u624b\u8155   \u2502 {wrist_angle:>8} \u2502 {wrist_score:>6} \u2502
+\u2502 \u8173\u90e8   \u2502 {leg_angle:>8} \u2502 {leg_score:>6} \u2502
+\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
+
+\u3010REBA \u8a55\u5206\u8a08\u7b97\u3011
+\u250c\u2500 Group A (\u8eab\u9ad4) \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
+\u2502  \u59ff\u52e2\u5206\u6578 A: {posture_score_a}
+\u2502  \u8ca0\u8377\u5206\u6578:   {load_score}
+\u2502  \u25ba Score A:  {score_a}
+\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
+\u250c\u2500 Group B (\u624b\u81c2) \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
+\u2502  \u59ff\u52e2\u5206\u6578 B: {posture_score_b}
+\u2502  \u63e1\u6301\u5206\u6578:   {coupling_score}
+\u2502  \u25ba Score B:  {score_b}
+\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
+\u250c\u2500 \u6700\u7d42\u8a08\u7b97 \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
+\u2502  Score C (A\u00d7B): {score_c}
+\u2502  \u6d3b\u52d5\u5206\u6578:      {activity_score}
+\u2502  \u25ba \u6700\u7d42\u5206\u6578:    {final_score}
+\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
+
+\u3010\u8a55\u4f30\u7d50\u679c\u3011
+\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
+  REBA \u7e3d\u5206: {reba_score}
+  \u98a8\u96aa\u7b49\u7d1a: {risk_text}
+\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
+  {risk_desc}
+\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
+"""
+
+
 class VideoController:
     """ViewModel - 協調管線、資料、事件"""
 
     def __init__(self):
         self._event_bus = EventBus()
         self._config = ProcessingConfig()
-        self._pipeline = VideoPipeline(self._event_bus, self._config)
+        # MediaPipe 模型跨多次 start() 重用，避免每次重新載入計算圖
+        self._holistic_cache = {}
+        self._pipeline = VideoPipeline(self._event_bus, self._config, self._holistic_cache)
         self._data_logger = DataLogger()
         self._reba_scorer = REBAScorer()
 
+        # 幀資料記錄在背景線程寫入 DataLogger（可能含 CSV 串流 I/O），不阻塞 UI 線程
+        self._log_q = queue.Queue(maxsize=self._config.DATA_LOG_QUEUE_SIZE)
+        self._log_lock = threading.Lock()
+        self._log_thread = threading.Thread(target=self._drain_log, daemon=True)
+        self._log_thread.start()
+        # 每幀在管線線程計數並送入記錄佇列，不受 UI 端合併/丟棄顯示幀影響
+        self._event_bus.on('frame_processed', self._on_frame_processed)
+
         self._is_processing = False
         self._frame_count = 0
+        self._dropped_log_rows = 0  # 記錄佇列逾時而未寫入 DataLogger 的幀數
         self._data_locked = False
-        self._locked_data = None
+        # 預先配置，record_frame 逐欄覆寫而非每幀建立新 dict；frame 為 None 表示尚無資料
+        self._locked_data = {
+            'frame': None,
+            'angles': {},
+            'reba_score': 0,
+            'risk_level': '',
+            'details': {},
+            'fps': 0.0
+        }
 
     # ========== 屬性 ==========
 
@@ -58,13 +155,23 @@ class VideoController:
     def frame_count(self) -> int:
         return self._frame_count
 
+    @property
+    def dropped_log_rows(self) -> int:
+        """本次處理因記錄佇列逾時而未寫入的幀數"""
+        return self._dropped_log_rows
+
     @property
     def data_locked(self) -> bool:
         return self._data_locked
 
     @property
     def locked_data(self) -> Optional[dict]:
-        return self._locked_data
+        return self._locked_data if self._locked_data['frame'] is not None else None
+
+    @property
+    def buffer_count(self) -> int:
+        """管線階段間的佇列容量（幀緩衝數）"""
+        return self._config.PIPELINE_QUEUE_SIZE
 
     # ========== 控制方法 ==========
 
@@ -82,13 +189,16 @@ class VideoController:
             show_values: 是否顯示角度數值
             show_skeleton: 是否顯示 MediaPipe 骨架
         """
-        self._pipeline = VideoPipeline(self._event_bus, self._config)
+        self._pipeline = VideoPipeline(self._event_bus, self._config, self._holistic_cache)
         self._pipeline.set_source(source)
         self._pipeline.set_parameters(side, load_weight, force_coupling)
         self._pipeline.set_display_options(show_lines, show_values, show_skeleton)
 
-        self._data_logger.clear_buffer()
+        self._sync_log()
+        with self._log_lock:
+            self._data_logger.clear_buffer()
         self._frame_count = 0
+        self._dropped_log_rows = 0
         self._is_processing = True
 
     def stop(self):
@@ -97,6 +207,12 @@ class VideoController:
             self._pipeline.stop()
         self._is_processing = False
 
+    def close_models(self):
+        """釋放快取的 MediaPipe 模型（程式結束時、管線停止後呼叫）"""
+        for holistic in self._holistic_cache.values():
+            holistic.close()
+        self._holistic_cache.clear()
+
     def pause(self):
         """暫停管線"""
         if self._pipeline:
@@ -122,6 +238,12 @@ class VideoController:
         if self._pipeline:
             self._pipeline.set_display_options(show_lines, show_values, show_skeleton)
 
+    def set_buffer_count(self, count: int):
+        """設定管線階段間的佇列容量，下次 start() 時生效"""
+        cfg = self._config
+        cfg.PIPELINE_QUEUE_SIZE = max(cfg.PIPELINE_QUEUE_SIZE_MIN,
+                                      min(cfg.PIPELINE_QUEUE_SIZE_MAX, int(count)))
+
     # ========== 資料方法 ==========
 
     def toggle_data_lock(self, locked: bool):
@@ -130,29 +252,59 @@ class VideoController:
 
     def record_frame(self, frame, angles, reba_score, risk_level, fps, details):
         """
-        記錄幀資料並更新鎖定資料。由 UI 層在收到 frame_processed 時呼叫。
+        更新鎖定資料（目前顯示的幀）。由 UI 層在顯示幀時呼叫；
+        幀計數與 DataLogger 記錄已由 _on_frame_processed 逐幀完成。
         """
-        import time
-        self._frame_count += 1
-
         if not self._data_locked:
-            self._locked_data = {
-                'frame': frame,
-                'angles': angles,
-                'reba_score': reba_score,
-                'risk_level': risk_level,
-                'details': details,
-                'fps': fps
-            }
-
-        timestamp = time.time()
-        self._data_logger.add_frame_data(
-            self._frame_count,
-            timestamp,
-            angles,
-            reba_score,
-            risk_level
-        )
+            data = self._locked_data
+            data['frame'] = frame
+            data['angles'] = angles
+            data['reba_score'] = reba_score
+            data['risk_level'] = risk_level
+            data['details'] = details
+            data['fps'] = fps
+
+    def _on_frame_processed(self, frame, angles, reba_score, risk_level, fps, details):
+        """EventBus 回調（管線線程）：每幀計數並送入記錄佇列"""
+        self._frame_count += 1
+        try:
+            # 佇列滿時短暫等待背景寫入（對管線施加背壓），逾時才丟棄並計數
+            self._log_q.put(
+                (self._frame_count, time.time(), angles, reba_score, risk_level),
+                timeout=self._config.DATA_LOG_PUT_TIMEOUT_S
+            )
+        except queue.Full:
+            self._dropped_log_rows += 1
+
+    def _drain_log(self):
+        """背景線程：批次取出佇列中的幀資料寫入 DataLogger"""
+        batch_size = self._config.DATA_LOG_BATCH_SIZE
+        while True:
+            batch = [self._log_q.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(self._log_q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._log_lock:
+                    for frame_id, timestamp, angles, reba_score, risk_level in batch:
+                        self._data_logger.add_frame_data(
+                            frame_id,
+                            timestamp,
+                            angles,
+                            reba_score,
+                            risk_level
+                        )
+            except Exception:
+                traceback.print_exc()  # 單批失敗不終止記錄線程
+            finally:
+                for _ in batch:
+                    self._log_q.task_done()
+
+    def _sync_log(self):
+        """等待佇列中的幀資料全部寫入 DataLogger（讀取/保存前呼叫）"""
+        self._log_q.join()
 
     def get_copy_text(self) -> str:
         """
@@ -161,7 +313,7 @@ class VideoController:
         Returns:
             格式化的報告文字
         """
-        if self._locked_data is None:
+        if self._locked_data['frame'] is None:
             return ""
 
         data = self._locked_data
@@ -170,79 +322,53 @@ class VideoController:
         reba_score = data['reba_score']
         risk_level = data['risk_level']
 
-        risk_labels = {
-            'negligible': '可忽略',
-            'low': '低風險',
-            'medium': '中等風險',
-            'high': '高風險',
-            'very_high': '極高風險'
-        }
-        risk_text = risk_labels.get(risk_level, risk_level)
-        risk_desc = self._reba_scorer.get_risk_description(risk_level)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        risk = _RISK_CACHE.get(risk_level)
+        if risk is None:
+            risk = _RISK_CACHE.setdefault(risk_level, (
+                _RISK_LABELS.get(risk_level, risk_level),
+                self._reba_scorer.get_risk_description(risk_level)
+            ))
+        risk_text, risk_desc = risk
 
         def fmt_angle(key):
             val = angles.get(key)
             return f"{val:.1f}\u00b0" if val is not None else "--"
 
-        return f"""\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
-          REBA \u4eba\u56e0\u5de5\u7a0b\u5206\u6790\u5831\u544a
-\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
-\u5206\u6790\u6642\u9593: {timestamp}
-
-\u3010\u95dc\u7bc0\u89d2\u5ea6\u6e2c\u91cf\u5024\u3011
-\u250c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
-\u2502 \u90e8\u4f4d   \u2502 \u89d2\u5ea6     \u2502 \u5206\u6578   \u2502
-\u251c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2524
-\u2502 \u9838\u90e8   \u2502 {fmt_angle('neck'):>8} \u2502 {details.get('neck_score', '--'):>6} \u2502
-\u2502 \u8ec0\u5e79   \u2502 {fmt_angle('trunk'):>8} \u2502 {details.get('trunk_score', '--'):>6} \u2502
-\u2502 \u4e0a\u81c2   \u2502 {fmt_angle('upper_arm'):>8} \u2502 {details.get('upper_arm_score', '--'):>6} \u2502
-\u2502 \u524d\u81c2   \u2502 {fmt_angle('forearm'):>8} \u2502 {details.get('forearm_score', '--'):>6} \u2502
-\u2502 \u624b\u8155   \u2502 {fmt_angle('wrist'):>8} \u2502 {details.get('wrist_score', '--'):>6} \u2502
-\u2502 \u8173\u90e8   \u2502 {fmt_angle('leg'):>8} \u2502 {details.get('leg_score', '--'):>6} \u2502
-\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
-
-\u3010REBA \u8a55\u5206\u8a08\u7b97\u3011
-\u250c\u2500 Group A (\u8eab\u9ad4) \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
-\u2502  \u59ff\u52e2\u5206\u6578 A: {details.get('posture_score_a', '--')}
-\u2502  \u8ca0\u8377\u5206\u6578:   {details.get('load_score', '--')}
-\u2502  \u25ba Score A:  {details.get('score_a', '--')}
-\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
-\u250c\u2500 Group B (\u624b\u81c2) \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
-\u2502  \u59ff\u52e2\u5206\u6578 B: {details.get('posture_score_b', '--')}
-\u2502  \u63e1\u6301\u5206\u6578:   {details.get('coupling_score', '--')}
-\u2502  \u25ba Score B:  {details.get('score_b', '--')}
-\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
-\u250c\u2500 \u6700\u7d42\u8a08\u7b97 \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510
-\u2502  Score C (A\u00d7B): {details.get('score_c', '--')}
-\u2502  \u6d3b\u52d5\u5206\u6578:      {details.get('activity_score', '--')}
-\u2502  \u25ba \u6700\u7d42\u5206\u6578:    {details.get('final_score', '--')}
-\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518
-
-\u3010\u8a55\u4f30\u7d50\u679c\u3011
-\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
-  REBA \u7e3d\u5206: {reba_score}
-  \u98a8\u96aa\u7b49\u7d1a: {risk_text}
-\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
-  {risk_desc}
-\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550
-"""
+        return _COPY_TEMPLATE.format(
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+            neck_angle=fmt_angle('neck'),
+            trunk_angle=fmt_angle('trunk'),
+            upper_arm_angle=fmt_angle('upper_arm'),
+            forearm_angle=fmt_angle('forearm'),
+            wrist_angle=fmt_angle('wrist'),
+            leg_angle=fmt_angle('leg'),
+            reba_score=reba_score,
+            risk_text=risk_text,
+            risk_desc=risk_desc,
+            **{key: details.get(key, '--') for key in _COPY_DETAIL_KEYS}
+        )
 
     def save_csv(self, filepath: str) -> str:
         """保存 CSV"""
         p = Path(filepath)
-        self._data_logger.output_dir = p.parent
-        return self._data_logger.save_to_csv(p.stem)
+        self._sync_log()
+        with self._log_lock:
+            self._data_logger.output_dir = p.parent
+            return self._data_logger.save_to_csv(p.stem)
 
     def save_json(self, filepath: str) -> str:
         """保存 JSON"""
         p = Path(filepath)
-        self._data_logger.output_dir = p.parent
-        return self._data_logger.save_to_json(p.stem)
+        self._sync_log()
+        with self._log_lock:
+            self._data_logger.output_dir = p.parent
+            return self._data_logger.save_to_json(p.stem)
 
     def get_log_summary(self) -> str:
         """取得統計摘要文字"""
-        stats = self._data_logger.get_statistics()
+        self._sync_log()
+        with self._log_lock:
+            stats = self._data_logger.get_statistics()
         if not stats:
             return "沒有統計資料"
         basic = stats.get('basic', {})
@@ -251,5 +377,7 @@ class VideoController:
     def on_processing_finished(self):
         """處理完成的回調"""
         self._is_processing = False
-        if self._data_logger.get_buffer_size() > 0:
-            self._data_logger.print_summary()
+        self._sync_log()
+        with self._log_lock:
+            if self._data_logger.get_buffer_size() > 0:
+                self._data_logger.print_summary()
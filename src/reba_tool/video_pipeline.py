@@ -6,25 +6,40 @@
 """
 
 import cv2
+import numpy as np
+import queue
+import threading
 import time
+import traceback
+from collections import deque
 import mediapipe as mp
 from typing import Optional
 
 from event_bus import EventBus
 from processing_config import ProcessingConfig
 from frame_renderer import FrameRenderer
-from angle_calculator import AngleCalculator
+from angle_calculator import AngleCalculator, NUM_POSE_LANDMARKS, landmarks_to_array
 from reba_scorer import REBAScorer
 
+_STAGE_STOP = object()  # 管線階段結束信號
+
 
 class VideoPipeline:
     """影片處理管線 - 框架無關"""
 
-    def __init__(self, event_bus: EventBus, config: ProcessingConfig = None):
+    def __init__(self, event_bus: EventBus, config: ProcessingConfig = None,
+                 holistic_cache: Optional[dict] = None):
         self._event_bus = event_bus
         self._config = config or ProcessingConfig()
         self._renderer = FrameRenderer(self._config)
 
+        # 由呼叫端持有的 Holistic 快取（跨多次 run 重用模型，None=每次建立並關閉）
+        self._holistic_cache = holistic_cache
+        self._holistic_preview = None  # 暫停預覽用輕量模型（延遲建立）
+        # 暫停預覽專用的繪圖器/評分器/landmark 緩衝區（延遲建立）：
+        # 預覽在擷取線程執行，不可與繪製線程共用同一組狀態
+        self._preview_tools = None
+
         # MediaPipe
         self._mp_holistic = mp.solutions.holistic
         self._mp_drawing = mp.solutions.drawing_utils
@@ -34,6 +49,9 @@ class VideoPipeline:
         self._angle_calc = AngleCalculator()
         self._reba_scorer = REBAScorer()
 
+        # 每幀重複使用的 landmark 座標緩衝區 [x, y, z, visibility]
+        self._landmark_buf = np.empty((NUM_POSE_LANDMARKS, 4), dtype=np.float64)
+
         # 來源設定
         self._video_source: Optional[str] = None
         self._camera_id: int = 0
@@ -50,12 +68,19 @@ class VideoPipeline:
 
         # 影片控制
         self._total_frames: int = 0
+        self._fps: float = 0.0
         self._current_frame_pos: int = 0
         self._seek_to_frame: int = -1
 
         # 狀態
         self._running: bool = False
         self._paused: bool = False
+        self._stage_error: Optional[str] = None  # 管線階段例外訊息（None=正常結束）
+
+        # 幀世代：跳轉（暫停預覽或播放中）時遞增，使之前擷取、仍在管線中的舊幀作廢。
+        # 繪製階段的比對 + 發送與預覽的遞增 + 發送以同一把鎖互斥，舊幀不會蓋過預覽
+        self._frame_gen: int = 0
+        self._emit_lock = threading.Lock()
 
     # ========== 設定方法 ==========
 
@@ -90,19 +115,36 @@ class VideoPipeline:
         阻塞式主循環。由呼叫端決定在哪個線程執行：
         - QThread: ui/video_worker.py
         - threading.Thread: CLI 用途
+
+        推論與繪製階段在內部背景線程執行，frame_processed 由繪製線程發送。
         """
         self._running = True
+        self._stage_error = None
         cap = self._open_video_source()
         if cap is None:
             return
 
         self._setup_video_properties(cap)
 
-        with self._create_holistic() as holistic:
-            self._process_video_loop(cap, holistic)
+        try:
+            if self._holistic_cache is None:
+                with self._create_holistic() as holistic:
+                    self._process_video_loop(cap, holistic)
+            else:
+                self._process_video_loop(cap, self._get_cached_holistic())
+        except Exception as e:
+            self._on_stage_error(e)  # 擷取階段或模型建立失敗
+
+        if self._holistic_cache is None and self._holistic_preview is not None:
+            self._holistic_preview.close()
+        self._holistic_preview = None
 
         cap.release()
-        self._event_bus.emit('processing_finished')
+        if self._stage_error is not None:
+            # 與開啟來源失敗相同：以 error_occurred 結束，不當作正常完成
+            self._event_bus.emit('error_occurred', message=self._stage_error)
+        else:
+            self._event_bus.emit('processing_finished')
 
     def stop(self):
         """停止處理"""
@@ -130,6 +172,11 @@ class VideoPipeline:
     def total_frames(self) -> int:
         return self._total_frames
 
+    @property
+    def fps(self) -> float:
+        """影片來源的原生幀率（未知時為 0）"""
+        return self._fps
+
     @property
     def video_source(self) -> Optional[str]:
         return self._video_source
@@ -142,8 +189,24 @@ class VideoPipeline:
 
     def _open_video_source(self):
         """開啟影片或攝影機"""
-        source = self._video_source if self._video_source else self._camera_id
-        cap = cv2.VideoCapture(source)
+        cfg = self._config
+        if self._video_source:
+            if cfg.USE_HW_ACCEL:
+                # FFMPEG 後端 + 硬體解碼（VAAPI/NVDEC/D3D11 等，不支援時自動退回軟體解碼）
+                cap = cv2.VideoCapture(
+                    self._video_source, cv2.CAP_FFMPEG,
+                    [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+                )
+                if not cap.isOpened():
+                    cap = cv2.VideoCapture(self._video_source)
+            else:
+                cap = cv2.VideoCapture(self._video_source)
+        else:
+            # 攝影機沿用預設後端（FFMPEG 無法開啟攝影機索引）
+            cap = cv2.VideoCapture(self._camera_id)
+            if cap.isOpened() and cfg.USE_MJPEG:
+                # MJPEG 傳輸：USB 頻寬遠低於未壓縮 YUV，須在設定解析度前指定
+                cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         if not cap.isOpened():
             self._event_bus.emit('error_occurred', message="無法開啟影片來源")
             return None
@@ -155,28 +218,112 @@ class VideoPipeline:
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, cfg.VIDEO_CAPTURE_WIDTH)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cfg.VIDEO_CAPTURE_HEIGHT)
         self._total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) if self._video_source else 0
+        self._fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
 
     def _create_holistic(self):
-        """建立 MediaPipe Holistic"""
+        """建立 MediaPipe Holistic（串流模式：沿用前一幀追蹤結果）"""
         cfg = self._config
         return self._mp_holistic.Holistic(
+            static_image_mode=False,
             min_detection_confidence=cfg.MIN_DETECTION_CONFIDENCE,
             min_tracking_confidence=cfg.MIN_TRACKING_CONFIDENCE,
             model_complexity=cfg.MEDIAPIPE_MODEL_COMPLEXITY
         )
 
+    def _get_cached_holistic(self):
+        """從快取取得 Holistic，參數不同時才建立新實例（由快取擁有者負責 close）"""
+        cfg = self._config
+        key = (cfg.MEDIAPIPE_MODEL_COMPLEXITY,
+               cfg.MIN_DETECTION_CONFIDENCE,
+               cfg.MIN_TRACKING_CONFIDENCE)
+        holistic = self._holistic_cache.get(key)
+        if holistic is None:
+            holistic = self._create_holistic()
+            self._holistic_cache[key] = holistic
+        return holistic
+
+    def _get_preview_holistic(self):
+        """
+        取得暫停預覽用 Holistic：最低複雜度、單張影像模式。
+        跳轉後的幀彼此不連續，追蹤與平滑沒有意義。
+        """
+        if self._holistic_preview is None:
+            cfg = self._config
+            key = ('preview', cfg.PREVIEW_MODEL_COMPLEXITY, cfg.MIN_DETECTION_CONFIDENCE)
+            cache = self._holistic_cache
+            holistic = cache.get(key) if cache is not None else None
+            if holistic is None:
+                holistic = self._mp_holistic.Holistic(
+                    static_image_mode=True,
+                    smooth_landmarks=False,
+                    min_detection_confidence=cfg.MIN_DETECTION_CONFIDENCE,
+                    model_complexity=cfg.PREVIEW_MODEL_COMPLEXITY
+                )
+                if cache is not None:
+                    cache[key] = holistic
+            self._holistic_preview = holistic
+        return self._holistic_preview
+
+    def _get_preview_tools(self):
+        """取得暫停預覽用 (繪圖器, 評分器, landmark 緩衝區)"""
+        if self._preview_tools is None:
+            self._preview_tools = (
+                FrameRenderer(self._config),
+                REBAScorer(),
+                np.empty((NUM_POSE_LANDMARKS, 4), dtype=np.float64),
+            )
+        return self._preview_tools
+
     def _process_video_loop(self, cap, holistic):
-        """主處理循環"""
+        """
+        主處理循環：擷取 → 推論 → 評分/繪製/發送 三階段管線。
+        各階段以有界佇列串接，吞吐量受最慢階段限制而非各階段總和。
+        擷取在呼叫端線程執行；推論與繪製各自一條背景線程
+        （MediaPipe 非線程安全，holistic 只在推論線程使用）。
+        """
+        size = self._config.PIPELINE_QUEUE_SIZE
+        cap_to_inf = queue.Queue(maxsize=size)
+        inf_to_render = queue.Queue(maxsize=size)
+        # OpenCL (T-API)：色彩轉換交給 GPU，僅在啟用且裝置可用時
+        use_umat = self._config.USE_GPU_BACKEND and cv2.ocl.haveOpenCL()
+        if use_umat:
+            cv2.ocl.setUseOpenCL(True)
+        # RGB 推論緩衝區回收：推論完成後歸還給擷取階段重複使用。
+        # 只有非阻塞存取（推論線程 append、擷取線程 pop），deque 本身為原子操作，不需 Queue 的鎖。
+        # 在途緩衝區最多為佇列容量加上兩端各一，以 maxlen 設上限；
+        # UMat 路徑每幀由 .get() 配置新陣列，不回收（rgb_free 為 None）
+        rgb_free = None if use_umat else deque(maxlen=size + 2)
+
+        # 攝影機：佇列滿時丟棄最舊幀維持低延遲；影片檔：阻塞等待，逐幀分析
+        drop_oldest = not self._video_source
+
+        stages = [
+            threading.Thread(
+                target=self._inference_stage,
+                args=(holistic, cap_to_inf, inf_to_render, drop_oldest, rgb_free),
+                daemon=True
+            ),
+            threading.Thread(
+                target=self._render_stage, args=(inf_to_render,), daemon=True
+            ),
+        ]
+        for stage in stages:
+            stage.start()
+
+        try:
+            self._capture_stage(cap, cap_to_inf, drop_oldest, rgb_free)
+        finally:
+            self._queue_put(cap_to_inf, _STAGE_STOP, drop_oldest)
+            for stage in stages:
+                stage.join()
+
+    def _capture_stage(self, cap, out_q, drop_oldest, rgb_free):
+        """擷取階段：處理暫停/跳轉、讀幀、回報進度、BGR→RGB"""
         frame_count = 0
-        start_time = time.time()
-
-        cached_angles = {}
-        cached_reba_score = 0
-        cached_risk_level = 'unknown'
-        cached_details = {}
-
         skip_n = self._config.PROCESS_EVERY_N_FRAMES
-        delay_ms = self._config.PROCESS_LOOP_DELAY_MS
+        # 節拍控制：以單調時鐘的截止時間限速，只睡剩餘時間
+        frame_period = self._config.PROCESS_LOOP_DELAY_MS / 1000.0
+        next_deadline = time.monotonic()
 
         while self._running:
             if not self._handle_pause_and_seek(cap):
@@ -188,29 +335,129 @@ class VideoPipeline:
 
             self._update_progress(cap)
 
+            # 跳幀時不送推論，rgb 為 None
+            rgb = None
             if skip_n <= 1 or frame_count % skip_n == 0:
-                results = holistic.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                cached_angles, cached_reba_score, cached_risk_level, cached_details = \
-                    self._process_pose_results(frame, results)
-
-            fps = self._calculate_fps(frame_count, start_time)
+                if rgb_free is None:
+                    # OpenCL：MediaPipe 需要 numpy 陣列，轉換後立即取回
+                    rgb = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2RGB).get()
+                else:
+                    # 重複使用推論階段歸還的緩衝區，沒有可用的才配置新的
+                    try:
+                        buf = rgb_free.pop()
+                    except IndexError:
+                        buf = None
+                    if buf is None or buf.shape != frame.shape:
+                        buf = np.empty_like(frame)
+                    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
             frame_count += 1
-            if frame_count % 30 == 0:
-                start_time = time.time()
 
-            self._renderer.draw_fps(frame, fps)
-            self._event_bus.emit(
-                'frame_processed',
-                frame=frame,
-                angles=cached_angles,
-                reba_score=cached_reba_score,
-                risk_level=cached_risk_level,
-                fps=fps,
-                details=cached_details
-            )
+            self._queue_put(out_q, (frame, rgb, self._frame_gen), drop_oldest)
+
+            if frame_period > 0:
+                next_deadline += frame_period
+                remaining = next_deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    # 已落後（處理過慢或剛從暫停恢復）：不補睡，重設基準
+                    next_deadline = time.monotonic()
+
+    def _inference_stage(self, holistic, in_q, out_q, drop_oldest, rgb_free):
+        """推論階段：獨佔 MediaPipe holistic 實例"""
+        try:
+            while True:
+                item = in_q.get()
+                if item is _STAGE_STOP:
+                    break
+                frame, rgb, gen = item
+                results = None
+                if rgb is not None:
+                    results = holistic.process(rgb)
+                    if rgb_free is not None:
+                        rgb_free.append(rgb)
+                self._queue_put(out_q, (frame, results, gen), drop_oldest)
+        except Exception as e:
+            self._on_stage_error(e)
+        finally:
+            self._queue_put(out_q, _STAGE_STOP, drop_oldest)
+
+    def _render_stage(self, in_q):
+        """評分/繪製/發送階段：姿態結果 → 角度、REBA、疊加繪製 → frame_processed"""
+        # FPS：逐幀間隔的指數移動平均
+        alpha = self._config.FPS_EMA_ALPHA
+        ema_dt = 1.0 / 30
+        last_time = time.monotonic()
+
+        cached_angles = {}
+        cached_reba_score = 0
+        cached_risk_level = 'unknown'
+        cached_details = {}
+
+        try:
+            while True:
+                item = in_q.get()
+                if item is _STAGE_STOP:
+                    break
+                if not self._running:
+                    continue  # 停止中：只排空佇列，不再發送
+
+                frame, results, gen = item
+                if gen != self._frame_gen:
+                    continue  # 跳轉預覽之前擷取的舊幀，不再發送
+                if results is not None:
+                    cached_angles, cached_reba_score, cached_risk_level, cached_details = \
+                        self._process_pose_results(frame, results)
+
+                now = time.monotonic()
+                ema_dt += alpha * ((now - last_time) - ema_dt)
+                last_time = now
+                fps = 1.0 / ema_dt if ema_dt > 0 else 0.0
+
+                self._renderer.draw_fps(frame, fps)
+                with self._emit_lock:
+                    if gen != self._frame_gen:
+                        continue  # 繪製期間已發送跳轉預覽
+                    self._event_bus.emit(
+                        'frame_processed',
+                        frame=frame,
+                        angles=cached_angles,
+                        reba_score=cached_reba_score,
+                        risk_level=cached_risk_level,
+                        fps=fps,
+                        details=cached_details
+                    )
+        except Exception as e:
+            self._on_stage_error(e)
+
+    def _on_stage_error(self, e: Exception):
+        """記錄管線階段例外並停止其他階段；run() 結束時以 error_occurred 回報第一個錯誤"""
+        traceback.print_exc()
+        self._running = False
+        if self._stage_error is None:
+            self._stage_error = f"處理管線錯誤: {e}"
 
-            if delay_ms > 0:
-                time.sleep(delay_ms / 1000.0)
+    def _queue_put(self, q, item, drop_oldest):
+        """
+        放入階段佇列。即時模式或停止中：滿則丟棄最舊項目；
+        否則阻塞等待下游（背壓）。
+        """
+        while True:
+            if drop_oldest or not self._running:
+                try:
+                    q.put_nowait(item)
+                    return
+                except queue.Full:
+                    try:
+                        q.get_nowait()
+                    except queue.Empty:
+                        pass
+            else:
+                try:
+                    q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
 
     def _handle_pause_and_seek(self, cap):
         """處理暫停和跳轉（支援暫停時預覽）"""
@@ -224,15 +471,27 @@ class VideoPipeline:
                 ret, frame = cap.read()
                 if ret:
                     cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-                    self._event_bus.emit(
-                        'frame_processed',
-                        frame=frame,
-                        angles={},
-                        reba_score=0,
-                        risk_level='unknown',
-                        fps=0.0,
-                        details={}
-                    )
+
+                    angles, reba_score, risk_level, details = {}, 0, 'unknown', {}
+                    if self._config.ENABLE_PREVIEW_MODEL:
+                        results = self._get_preview_holistic().process(
+                            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        )
+                        angles, reba_score, risk_level, details = \
+                            self._process_pose_results(frame, results, preview=True)
+
+                    with self._emit_lock:
+                        # 作廢仍在推論/繪製階段的舊幀，避免蓋過預覽
+                        self._frame_gen += 1
+                        self._event_bus.emit(
+                            'frame_processed',
+                            frame=frame,
+                            angles=angles,
+                            reba_score=reba_score,
+                            risk_level=risk_level,
+                            fps=0.0,
+                            details=details
+                        )
 
             time.sleep(0.05)
 
@@ -243,6 +502,9 @@ class VideoPipeline:
             cap.set(cv2.CAP_PROP_POS_FRAMES, self._seek_to_frame)
             self._current_frame_pos = self._seek_to_frame
             self._seek_to_frame = -1
+            with self._emit_lock:
+                # 播放中跳轉：作廢仍在推論/繪製階段的跳轉前舊幀，不再發送與記錄
+                self._frame_gen += 1
 
         return True
 
@@ -256,41 +518,40 @@ class VideoPipeline:
                 total_frames=self._total_frames
             )
 
-    def _process_pose_results(self, frame, results):
-        """處理姿態檢測結果"""
+    def _process_pose_results(self, frame, results, preview=False):
+        """處理姿態檢測結果（preview=True 時使用暫停預覽專用的狀態，供擷取線程呼叫）"""
+        if preview:
+            renderer, scorer, landmark_buf = self._get_preview_tools()
+        else:
+            renderer, scorer, landmark_buf = self._renderer, self._reba_scorer, self._landmark_buf
+
         angles = {}
         reba_score = 0
         risk_level = 'unknown'
         details = {}
 
         if results.pose_landmarks:
+            # landmark 只轉換一次，角度計算與繪圖共用同一陣列
+            points = landmarks_to_array(results.pose_landmarks, landmark_buf)
             if self._show_skeleton:
-                self._renderer.draw_pose_landmarks(
+                renderer.draw_pose_landmarks(
                     frame, results.pose_landmarks,
                     self._mp_drawing, self._mp_holistic, self._mp_drawing_styles,
-                    side=self._side
+                    side=self._side, points=points
                 )
-            angles = self._angle_calc.calculate_all_angles(results.pose_landmarks, self._side)
-            frame, angle_text_items = self._renderer.draw_angle_lines(
-                frame, results.pose_landmarks, angles,
+            angles = self._angle_calc.calculate_all_angles(points, self._side)
+            frame, angle_text_items = renderer.draw_angle_lines(
+                frame, points, angles,
                 self._side, self._show_angle_lines, self._show_angle_values
             )
 
-            reba_score, risk_level, details = self._reba_scorer.calculate_reba_score(
+            reba_score, risk_level, details = scorer.calculate_reba_score(
                 angles, self._load_weight, self._force_coupling
             )
 
-            color = self._renderer.get_color_for_risk(risk_level)
-            reba_text_items = self._renderer.build_reba_text_items(reba_score, risk_level, color)
+            color = renderer.get_color_for_risk(risk_level)
+            reba_text_items = renderer.build_reba_text_items(reba_score, risk_level, color)
             all_text_items = reba_text_items + angle_text_items
-            self._renderer.draw_all_texts(frame, all_text_items)
+            renderer.draw_all_texts(frame, all_text_items)
 
         return angles, reba_score, risk_level, details
-
-    @staticmethod
-    def _calculate_fps(frame_count, start_time):
-        """計算 FPS"""
-        if frame_count % 30 == 0:
-            elapsed = time.time() - start_time
-            return 30 / elapsed if elapsed > 0 else 30.0
-        return 30.0
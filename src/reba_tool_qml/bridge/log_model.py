@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+日誌模型 (Log Model)
+固定容量的系統日誌列表，QAbstractListModel 讓 QML ListView 逐筆增量更新。
+"""
+
+import time
+from collections import deque
+
+from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex
+
+_MAX_LOG_MESSAGES = 500  # 保留的日誌筆數上限，超過時移除最舊的
+
+
+class LogModel(QAbstractListModel):
+    """系統日誌列表（每次新增只通知插入/移除的單列）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._messages: deque = deque(maxlen=_MAX_LOG_MESSAGES)
+        # 時間戳字串快取（同一秒內的訊息共用）
+        self._ts_second = None
+        self._ts_text = ""
+
+    def roleNames(self):
+        return {Qt.DisplayRole: b"display"}
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._messages)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self._messages[index.row()]
+
+    def append(self, message: str):
+        """新增一筆帶時間戳的日誌"""
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_text = time.strftime("%H:%M:%S", time.localtime(now))
+
+        if len(self._messages) == self._messages.maxlen:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._messages.popleft()
+            self.endRemoveRows()
+
+        row = len(self._messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._messages.append(f"[{self._ts_text}] {message}")
+        self.endInsertRows()
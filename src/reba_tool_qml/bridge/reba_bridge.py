@@ -5,10 +5,20 @@ REBA 分數橋接 (REBA Bridge)
 由 VideoBridge.frameProcessed 觸發更新。
 """
 
-from PySide6.QtCore import QObject, Property, Signal
+from operator import itemgetter
+
+from PySide6.QtCore import QObject, Property, Signal, Slot
 
 from reba_scorer import REBAScorer
 
+# 一次取出 details 中全部分數欄位（C 實作，取代逐一 dict.get）
+_get_detail_scores = itemgetter(*REBAScorer.DETAIL_SCORE_KEYS)
+# details 缺欄位時的分數（全部歸零）
+_ZERO_SCORES = (0,) * len(REBAScorer.DETAIL_SCORE_KEYS)
+
+# 無風險等級時的顯示值：(中文名稱, 顏色, 描述)
+_EMPTY_RISK = ("", "#FFFFFF", "")
+
 
 class RebaBridge(QObject):
     """QML↔REBA 分數橋接"""
@@ -18,6 +28,11 @@ class RebaBridge(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._scorer = REBAScorer()
+        # 風險等級 → (中文名稱, 顏色, 描述)，只依等級而定，預先建表
+        self._risk_table = {
+            level: self._risk_info(level)
+            for level in (*REBAScorer.RISK_LEVELS, 'unknown')
+        }
 
         # 當前分數資料
         self._reba_score = 0
@@ -159,12 +174,12 @@ class RebaBridge(QObject):
 
     # ========== 更新方法 ==========
 
-    def update_from_frame(self, frame, angles, reba_score, risk_level, fps, details):
+    @Slot(dict, int, str, float, dict)
+    def update_from_frame(self, angles, reba_score, risk_level, fps, details):
         """
         由 VideoBridge.frameProcessed 信號呼叫
 
         Args:
-            frame: OpenCV frame (不使用)
             angles: 角度字典
             reba_score: REBA 分數
             risk_level: 風險等級字串
@@ -174,25 +189,34 @@ class RebaBridge(QObject):
         self._angles = angles or {}
         self._reba_score = reba_score
         self._risk_level = risk_level
-        self._risk_level_zh = self._scorer.get_risk_name_zh(risk_level) if risk_level else ""
-        self._risk_color = self._scorer.get_risk_color(risk_level) if risk_level else "#FFFFFF"
-        self._risk_description = self._scorer.get_risk_description(risk_level) if risk_level else ""
+        if not risk_level:
+            risk_info = _EMPTY_RISK
+        else:
+            risk_info = self._risk_table.get(risk_level)
+            if risk_info is None:
+                risk_info = self._risk_info(risk_level)
+        self._risk_level_zh, self._risk_color, self._risk_description = risk_info
 
         if details:
-            self._neck_score = details.get('neck_score', 0)
-            self._trunk_score = details.get('trunk_score', 0)
-            self._leg_score = details.get('leg_score', 0)
-            self._upper_arm_score = details.get('upper_arm_score', 0)
-            self._forearm_score = details.get('forearm_score', 0)
-            self._wrist_score = details.get('wrist_score', 0)
-            self._posture_score_a = details.get('posture_score_a', 0)
-            self._posture_score_b = details.get('posture_score_b', 0)
-            self._load_score = details.get('load_score', 0)
-            self._coupling_score = details.get('coupling_score', 0)
-            self._score_a = details.get('score_a', 0)
-            self._score_b = details.get('score_b', 0)
-            self._score_c = details.get('score_c', 0)
-            self._activity_score = details.get('activity_score', 0)
-            self._final_score = details.get('final_score', 0)
+            # 以單次 C 層級取值 + tuple 解包取代 15 次 get；
+            # REBAScorer 產生的 details 必含全部欄位，不完整時明確歸零
+            try:
+                scores = _get_detail_scores(details)
+            except (KeyError, TypeError):
+                scores = _ZERO_SCORES
+            (self._neck_score, self._trunk_score, self._leg_score,
+             self._upper_arm_score, self._forearm_score, self._wrist_score,
+             self._posture_score_a, self._posture_score_b,
+             self._load_score, self._coupling_score,
+             self._score_a, self._score_b, self._score_c,
+             self._activity_score, self._final_score) = scores
 
         self.scoreChanged.emit()
+
+    def _risk_info(self, risk_level):
+        """風險等級 → (中文名稱, 顏色, 描述)"""
+        return (
+            self._scorer.get_risk_name_zh(risk_level),
+            self._scorer.get_risk_color(risk_level),
+            self._scorer.get_risk_description(risk_level),
+        )
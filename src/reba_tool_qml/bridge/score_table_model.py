@@ -5,9 +5,15 @@
 QAbstractTableModel 讓 QML TableView 直接使用。
 """
 
-from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex, Property, Signal
+from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex, Property, Signal, QTimer
 from PySide6.QtGui import QColor
 
+# 逐幀更新合併間隔（約 60 Hz）：期間內只保留最新一筆，計時器到期時一次通知
+_FLUSH_INTERVAL_MS = 16
+
+_FMT_CACHE_SIZE = 256  # 顯示文字快取上限，超過時整批清空
+_MISS = object()  # 靜態快取查無此格的標記（快取值本身可能為 None）
+
 
 class ScoreTableModel(QAbstractTableModel):
     """17 行 x 5 欄角度/分數明細表"""
@@ -19,6 +25,15 @@ class ScoreTableModel(QAbstractTableModel):
     SectionRole = Qt.UserRole + 3
     TextAlignRole = Qt.UserRole + 4
 
+    # roleNames 回傳的固定對照（view 查詢時直接回傳，不每次重建）
+    _ROLE_NAMES = {
+        DisplayRole: b"display",
+        BackgroundColorRole: b"bgColor",
+        FontBoldRole: b"fontBold",
+        SectionRole: b"section",
+        TextAlignRole: b"textAlign",
+    }
+
     scoreDataChanged = Signal()
 
     # 表格結構定義（與 main_window.py 一致）
@@ -43,6 +58,9 @@ class ScoreTableModel(QAbstractTableModel):
         ('REBA總分', 'final_score', '', '', False, True),
     ]
 
+    _ROW_COUNT = len(TABLE_STRUCTURE)
+    _COLUMN_COUNT = 5
+
     # 角度 key 集合
     ANGLE_KEYS = {'neck', 'trunk', 'upper_arm', 'forearm', 'wrist', 'leg'}
 
@@ -50,50 +68,88 @@ class ScoreTableModel(QAbstractTableModel):
         super().__init__(parent)
         self._angles = {}
         self._details = {}
+        # 待套用的最新資料（None = 無待更新）
+        self._pending = None
+        # (is_angle, 值) → 顯示文字；姿勢連續變化，相鄰幀多半重複相同數值
+        self._fmt_cache = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
 
     def roleNames(self):
-        return {
-            Qt.DisplayRole: b"display",
-            self.BackgroundColorRole: b"bgColor",
-            self.FontBoldRole: b"fontBold",
-            self.SectionRole: b"section",
-            self.TextAlignRole: b"textAlign",
-        }
+        return self._ROLE_NAMES
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self.TABLE_STRUCTURE)
+        return self._ROW_COUNT
 
     def columnCount(self, parent=QModelIndex()):
-        return 5
+        return self._COLUMN_COUNT
 
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
 
-        row = index.row()
-        col = index.column()
-        left_name, left_key, right_name, right_key, is_header, is_highlight = self.TABLE_STRUCTURE[row]
+        key = (index.row(), index.column(), role)
+        value = self._STATIC.get(key, _MISS)
+        if value is not _MISS:
+            return value
+
+        # 動態格：資料行的角度/分數欄（只有 DisplayRole 隨資料變化）
+        cell = self._DYNAMIC_CELLS.get(key)
+        if cell is not None:
+            return self._get_value(*cell)
+        return None
+
+    @classmethod
+    def _build_static_cache(cls):
+        """
+        預先計算所有不隨資料變化的 (row, col, role) → 值，
+        以及動態格 (row, col, DisplayRole) → (key, 是否為角度)
+        """
+        static = {}
+        dynamic = {}
+        roles = (int(Qt.DisplayRole), int(cls.BackgroundColorRole), int(cls.FontBoldRole),
+                 int(cls.SectionRole), int(cls.TextAlignRole))
+        display = roles[0]
+        for row, (_, left_key, _, right_key, is_header, _) in enumerate(cls.TABLE_STRUCTURE):
+            for col in range(cls._COLUMN_COUNT):
+                for role in roles:
+                    if row > 0 and not is_header and role == display:
+                        if col == 1:
+                            dynamic[(row, col, role)] = (left_key, left_key in cls.ANGLE_KEYS)
+                            continue
+                        if col == 4 and right_key:
+                            dynamic[(row, col, role)] = (right_key, right_key in cls.ANGLE_KEYS)
+                            continue
+                    static[(row, col, role)] = cls._static_value(row, col, role)
+        return static, dynamic
+
+    @classmethod
+    def _static_value(cls, row, col, role):
+        """單一靜態格的 role 值（僅建立快取時呼叫）"""
+        left_name, left_key, right_name, right_key, is_header, is_highlight = cls.TABLE_STRUCTURE[row]
 
         # === 第一行標題 ===
         if row == 0:
             headers = ['部位', '角度', '', '  ', '分數']
             if role == Qt.DisplayRole:
                 return headers[col] if col < len(headers) else ""
-            if role == self.BackgroundColorRole:
+            if role == cls.BackgroundColorRole:
                 return "#1a2235"
-            if role == self.FontBoldRole:
+            if role == cls.FontBoldRole:
                 return True
-            if role == self.TextAlignRole:
+            if role == cls.TextAlignRole:
                 return "center"
             return None
 
         # === 區段標題行 ===
         if is_header:
-            if role == self.BackgroundColorRole:
+            if role == cls.BackgroundColorRole:
                 return "#1a2235" if right_name else "#151b2c"
-            if role == self.FontBoldRole:
+            if role == cls.FontBoldRole:
                 return True
-            if role == self.TextAlignRole:
+            if role == cls.TextAlignRole:
                 return "center"
             if role == Qt.DisplayRole:
                 if right_name:
@@ -102,7 +158,7 @@ class ScoreTableModel(QAbstractTableModel):
                 else:
                     # 全跨行標題
                     return left_name if col == 0 else ""
-            if role == self.SectionRole:
+            if role == cls.SectionRole:
                 return "span" if not right_name else "split"
             return None
 
@@ -113,13 +169,13 @@ class ScoreTableModel(QAbstractTableModel):
         if left_name == 'REBA總分':
             bg_color = "#2a1525"
 
-        if role == self.BackgroundColorRole:
+        if role == cls.BackgroundColorRole:
             return bg_color or ""
 
-        if role == self.FontBoldRole:
+        if role == cls.FontBoldRole:
             return is_highlight or (left_name == 'REBA總分')
 
-        if role == self.TextAlignRole:
+        if role == cls.TextAlignRole:
             if col in (0, 2, 3):
                 return "center"
             return "right"
@@ -127,37 +183,58 @@ class ScoreTableModel(QAbstractTableModel):
         if role == Qt.DisplayRole:
             if col == 0:
                 return left_name
-            elif col == 1:
-                return self._get_value(left_key)
             elif col == 2:
                 return ""
             elif col == 3:
                 return right_name
-            elif col == 4:
-                return self._get_value(right_key) if right_key else ""
+            elif col == 4 and not right_key:
+                return ""
 
         return None
 
-    def _get_value(self, key):
-        """取得角度或分數值的顯示文字"""
-        if not key:
-            return ""
-
-        if key in self.ANGLE_KEYS:
-            val = self._angles.get(key)
-            if val is not None:
-                return f"{val:.1f}\u00b0"
-            return "--"
-        else:
-            val = self._details.get(key)
-            if val is not None:
-                return str(val)
+    def _get_value(self, key, is_angle):
+        """取得角度或分數值的顯示文字（is_angle 於建立快取時已決定）"""
+        val = (self._angles if is_angle else self._details).get(key)
+        if val is None:
             return "--"
 
+        cache_key = (is_angle, val)
+        text = self._fmt_cache.get(cache_key)
+        if text is None:
+            text = f"{val:.1f}\u00b0" if is_angle else str(val)
+            if len(self._fmt_cache) >= _FMT_CACHE_SIZE:
+                self._fmt_cache.clear()
+            self._fmt_cache[cache_key] = text
+        return text
+
     def update_data(self, angles, details):
-        """更新角度和分數資料"""
-        self._angles = angles or {}
-        self._details = details or {}
-        self.beginResetModel()
-        self.endResetModel()
+        """
+        更新角度和分數資料（每幀呼叫）。
+        只暫存最新一筆，由單次計時器合併後套用，不逐幀通知 view。
+        """
+        self._pending = (angles or {}, details or {})
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """套用最新資料：值有變化時以單一 dataChanged 通知所有資料格"""
+        if self._pending is None:
+            return
+        angles, details = self._pending
+        self._pending = None
+        if angles == self._angles and details == self._details:
+            return
+        self._angles = angles
+        self._details = details
+        # 表格結構固定，只有數值欄（第 1~4 欄）的顯示文字會變：
+        # 不重置 model，delegate 與靜態 role 保持不變
+        self.dataChanged.emit(
+            self.index(1, 1),
+            self.index(self._ROW_COUNT - 1, self._COLUMN_COUNT - 1),
+            [Qt.DisplayRole]
+        )
         self.scoreDataChanged.emit()
+
+
+# 靜態 role 值與動態格對照（表格結構固定，類別載入時建立一次）
+ScoreTableModel._STATIC, ScoreTableModel._DYNAMIC_CELLS = ScoreTableModel._build_static_cache()
@@ -17,6 +17,7 @@ class SettingsBridge(QObject):
     showAngleLinesChanged = Signal()
     showAngleValuesChanged = Signal()
     dataLockedChanged = Signal()
+    autoRecordChanged = Signal()
 
     # 參數變更通知（VideoBridge 監聽此信號）
     parametersChanged = Signal(str, float, str)
@@ -30,6 +31,7 @@ class SettingsBridge(QObject):
         self._show_angle_lines = True
         self._show_angle_values = True
         self._data_locked = False
+        self._auto_record = False  # 開始處理時自動全程錄影（預設關閉）
 
     # ========== Properties ==========
 
@@ -42,7 +44,7 @@ class SettingsBridge(QObject):
         if self._side != value:
             self._side = value
             self.sideChanged.emit()
-            self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+            self._emit_parameters()
 
     @Property(float, notify=loadWeightChanged)
     def loadWeight(self):
@@ -53,7 +55,7 @@ class SettingsBridge(QObject):
         if self._load_weight != value:
             self._load_weight = value
             self.loadWeightChanged.emit()
-            self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+            self._emit_parameters()
 
     @Property(str, notify=couplingChanged)
     def coupling(self):
@@ -64,7 +66,7 @@ class SettingsBridge(QObject):
         if self._coupling != value:
             self._coupling = value
             self.couplingChanged.emit()
-            self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+            self._emit_parameters()
 
     @Property(bool, notify=showAngleLinesChanged)
     def showAngleLines(self):
@@ -75,7 +77,7 @@ class SettingsBridge(QObject):
         if self._show_angle_lines != value:
             self._show_angle_lines = value
             self.showAngleLinesChanged.emit()
-            self.displayOptionsChanged.emit(self._show_angle_lines, self._show_angle_values)
+            self._emit_display_options()
 
     @Property(bool, notify=showAngleValuesChanged)
     def showAngleValues(self):
@@ -86,7 +88,7 @@ class SettingsBridge(QObject):
         if self._show_angle_values != value:
             self._show_angle_values = value
             self.showAngleValuesChanged.emit()
-            self.displayOptionsChanged.emit(self._show_angle_lines, self._show_angle_values)
+            self._emit_display_options()
 
     @Property(bool, notify=dataLockedChanged)
     def dataLocked(self):
@@ -98,6 +100,16 @@ class SettingsBridge(QObject):
             self._data_locked = value
             self.dataLockedChanged.emit()
 
+    @Property(bool, notify=autoRecordChanged)
+    def autoRecord(self):
+        return self._auto_record
+
+    @autoRecord.setter
+    def autoRecord(self, value):
+        if self._auto_record != value:
+            self._auto_record = value
+            self.autoRecordChanged.emit()
+
     # ========== Slots ==========
 
     @Slot(str)
@@ -123,3 +135,17 @@ class SettingsBridge(QObject):
     @Slot(bool)
     def setDataLocked(self, value):
         self.dataLocked = value
+
+    @Slot(bool)
+    def setAutoRecord(self, value):
+        self.autoRecord = value
+
+    # ========== 內部方法 ==========
+
+    def _emit_parameters(self):
+        """發送目前的評分參數（side/loadWeight/coupling 共用）"""
+        self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+
+    def _emit_display_options(self):
+        """發送目前的顯示選項"""
+        self.displayOptionsChanged.emit(self._show_angle_lines, self._show_angle_values)
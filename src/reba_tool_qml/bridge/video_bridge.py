@@ -2,19 +2,37 @@
 """
 影片橋接 (Video Bridge)
 包裝 VideoController，暴露控制 Slot 和狀態 Property 給 QML。
-收到 VideoWorker.frame_ready → 更新 image_provider → 遞增 frameCounter。
+收到 VideoWorker.frame_ready → 寫入 VideoFrameSink（QML VideoOutput 顯示）。
 """
 
 import os
-from datetime import datetime
+import time
 
-from PySide6.QtCore import QObject, Property, Signal, Slot
+from PySide6.QtCore import QObject, Property, QTimer, Signal, Slot
 
 from video_controller import VideoController
 from ui.video_worker import VideoWorker
 from bridge.video_recorder import VideoRecorder
 
 
+# 屬性通知合併間隔（約 60 Hz，對齊 QML 畫面更新頻率）
+_NOTIFY_INTERVAL_MS = 16
+
+# 待發送的屬性通知旗標
+_DIRTY_FPS = 1
+_DIRTY_COUNT = 2
+_DIRTY_COUNTER = 4
+
+# suggestFilePath 各類型的檔名樣板（{} 代入時間戳）
+_FILE_NAME_TEMPLATES = {
+    "image": "reba_frame_{}.png",
+    "video": "reba_video_{}.mp4",
+    "csv": "reba_analysis_{}.csv",
+    "json": "reba_stats_{}.json",
+}
+_DEFAULT_FILE_NAME_TEMPLATE = "reba_{}.dat"
+
+
 class VideoBridge(QObject):
     """QML↔VideoController 橋接"""
 
@@ -27,9 +45,11 @@ class VideoBridge(QObject):
     totalFramesChanged = Signal()
     currentFrameChanged = Signal()
     videoSourceChanged = Signal()
+    bufferCountChanged = Signal()
 
-    # 幀處理完成（帶完整資料，供 RebaBridge 使用）
-    frameProcessed = Signal(object, dict, int, str, float, dict)
+    # 幀處理完成（角度, REBA 分數, 風險等級, FPS, 詳細分數；供 RebaBridge 等使用）
+    # 影像已交給 frame sink，不經信號傳遞
+    frameProcessed = Signal(dict, int, str, float, dict)
 
     # 處理結束
     processingFinished = Signal()
@@ -41,9 +61,9 @@ class VideoBridge(QObject):
     recordingStarted = Signal()
     recordingStopped = Signal(str)
 
-    def __init__(self, image_provider, parent=None):
+    def __init__(self, frame_sink, parent=None):
         super().__init__(parent)
-        self._image_provider = image_provider
+        self._frame_sink = frame_sink
         self._controller = VideoController()
         self._worker = None
 
@@ -52,8 +72,22 @@ class VideoBridge(QObject):
         self._total_frames = 0
         self._current_frame = 0
         self._video_source = ""
-        self._recorder = VideoRecorder()
-        self._auto_recording = False  # 全程自動錄影旗標
+        self._recorder = None  # 首次錄影時才建立
+        self._auto_recording = False  # 目前錄影是否為全程自動錄影
+        self._auto_record_on_start = False  # 開始處理時是否自動全程錄影（SettingsBridge 設定）
+
+        # 輸出根目錄只建立一次，之後產生路徑不再碰檔案系統
+        self._results_dir = os.path.join(os.getcwd(), "results").replace("\\", "/")
+        os.makedirs(self._results_dir, exist_ok=True)
+        # 時間戳字串快取（秒級解析度，同一秒內重複使用）
+        self._ts_second = None
+        self._ts_text = ""
+
+        # 每幀只設旗標，由計時器合併發送 *Changed，避免高 FPS 時的屬性通知風暴
+        self._dirty = 0
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setInterval(_NOTIFY_INTERVAL_MS)
+        self._notify_timer.timeout.connect(self._flush_notifications)
 
     # ========== Properties ==========
 
@@ -76,7 +110,7 @@ class VideoBridge(QObject):
 
     @Property(int, notify=frameCounterChanged)
     def frameCounter(self):
-        """每幀遞增，QML Image 綁定此值觸發重繪"""
+        """每幀遞增（已處理幀數計數，0 表示尚無影像）"""
         return self._frame_counter
 
     @Property(int, notify=totalFramesChanged)
@@ -93,7 +127,27 @@ class VideoBridge(QObject):
 
     @Property(bool, notify=isRecordingChanged)
     def isRecording(self):
-        return self._recorder.is_recording
+        return self._is_recording()
+
+    @Property(int, notify=bufferCountChanged)
+    def bufferCount(self):
+        """管線幀緩衝數（階段間佇列容量），依攝影機調整，下次開始處理時生效"""
+        return self._controller.buffer_count
+
+    @bufferCount.setter
+    def bufferCount(self, value):
+        if value != self._controller.buffer_count:
+            self._controller.set_buffer_count(value)
+            self.bufferCountChanged.emit()
+
+    def _is_recording(self) -> bool:
+        return self._recorder is not None and self._recorder.is_recording
+
+    def _ensure_recorder(self) -> VideoRecorder:
+        """取得 recorder，尚未建立時才建立"""
+        if self._recorder is None:
+            self._recorder = VideoRecorder()
+        return self._recorder
 
     # ========== 暴露 controller 給其他 bridge ==========
 
@@ -154,6 +208,11 @@ class VideoBridge(QObject):
             self._worker = None
         self._on_finished()
 
+    @Slot(bool)
+    def setAutoRecord(self, enabled):
+        """設定開始處理時是否自動全程錄影"""
+        self._auto_record_on_start = bool(enabled)
+
     @Slot(int)
     def seekFrame(self, frame_number):
         """跳轉到指定幀"""
@@ -169,10 +228,15 @@ class VideoBridge(QObject):
         """即時更新顯示選項"""
         self._controller.set_display_options(show_lines, show_values)
 
+    @Slot(QObject)
+    def setVideoSink(self, sink):
+        """QML VideoOutput 建立完成後傳入其 QVideoSink"""
+        self._frame_sink.set_sink(sink)
+
     @Slot(str)
     def saveImage(self, path):
         """保存當前標註影像"""
-        img = self._image_provider.get_current_image()
+        img = self._frame_sink.get_current_image()
         if img is None or img.isNull():
             self.errorOccurred.emit("無可保存的影像")
             return
@@ -184,27 +248,25 @@ class VideoBridge(QObject):
     @Slot(str, result=str)
     def suggestFilePath(self, file_type):
         """根據類型生成建議檔案路徑"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_dir = os.path.join(os.getcwd(), "results")
-        os.makedirs(results_dir, exist_ok=True)
-
-        names = {
-            "image": f"reba_frame_{timestamp}.png",
-            "video": f"reba_video_{timestamp}.mp4",
-            "csv": f"reba_analysis_{timestamp}.csv",
-            "json": f"reba_stats_{timestamp}.json",
-        }
-        filename = names.get(file_type, f"reba_{timestamp}.dat")
-        return os.path.join(results_dir, filename).replace("\\", "/")
+        template = _FILE_NAME_TEMPLATES.get(file_type, _DEFAULT_FILE_NAME_TEMPLATE)
+        return f"{self._results_dir}/{template.format(self._timestamp())}"
+
+    def _timestamp(self) -> str:
+        """目前時間的 YYYYMMDD_HHMMSS 字串（同一秒內直接回傳快取）"""
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_text = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        return self._ts_text
 
     @Slot()
     def startRecording(self):
         """手動開始錄影片段"""
-        if self._recorder.is_recording:
+        if self._is_recording():
             return
         path = self.suggestFilePath("video")
         fps = self._fps if self._fps > 0 else 30.0
-        self._recorder.start(path, fps)
+        self._ensure_recorder().start(path, fps, realtime=not self._video_source)
         self._auto_recording = False
         self.isRecordingChanged.emit()
         self.recordingStarted.emit()
@@ -212,7 +274,7 @@ class VideoBridge(QObject):
     @Slot()
     def stopRecording(self):
         """手動停止錄影"""
-        if not self._recorder.is_recording:
+        if not self._is_recording():
             return
         path = self._recorder.stop()
         self._auto_recording = False
@@ -235,52 +297,77 @@ class VideoBridge(QObject):
         self.frameCounterChanged.emit()
         self.isProcessingChanged.emit()
 
-        # 自動開始全程錄影
-        auto_path = self.suggestFilePath("video")
-        self._recorder.start(auto_path, 30.0)
-        self._auto_recording = True
-        self.isRecordingChanged.emit()
-        self.recordingStarted.emit()
+        # 自動開始全程錄影（僅在設定啟用時；預設不開啟編碼器）
+        if self._auto_record_on_start and not self._is_recording():
+            auto_path = self.suggestFilePath("video")
+            self._ensure_recorder().start(auto_path, 30.0, realtime=not self._video_source)
+            self._auto_recording = True
+            self.isRecordingChanged.emit()
+            self.recordingStarted.emit()
 
         # 建立 QThread worker（直接複用 reba_tool 的 VideoWorker）
+        # drop_if_busy 僅用於攝影機：即時來源寧可丟幀也不累積延遲；
+        # 影片檔逐幀送達，錄影不缺幀（資料記錄與幀計數已由 controller 逐幀完成）
         self._worker = VideoWorker(
             self._controller.pipeline,
-            self._controller.event_bus
+            self._controller.event_bus,
+            drop_if_busy=not self._video_source
         )
         self._worker.frame_ready.connect(self._handle_frame)
         self._worker.finished_signal.connect(self._on_finished)
         self._worker.error_signal.connect(self._on_error)
         self._worker.progress_signal.connect(self._on_progress)
         self._worker.start()
+        self._notify_timer.start()
 
     def _handle_frame(self, frame, angles, reba_score, risk_level, fps, details):
         """收到工作線程的幀資料"""
-        # 記錄資料
-        self._controller.record_frame(frame, angles, reba_score, risk_level, fps, details)
-
-        # 錄影：寫入標註幀
-        if self._recorder.is_recording:
-            self._recorder.write_frame(frame)
-
-        # 更新影像提供者
-        self._image_provider.update_frame(frame)
-
-        # 更新屬性
-        self._fps = fps
-        self.fpsChanged.emit()
-        self.frameCountChanged.emit()
-
-        # 遞增 frameCounter 觸發 QML Image 重繪
-        self._frame_counter += 1
-        self.frameCounterChanged.emit()
-
-        # 發射幀處理完成信號（供 RebaBridge 等使用）
-        self.frameProcessed.emit(frame, angles, reba_score, risk_level, fps, details)
+        try:
+            # 記錄資料
+            self._controller.record_frame(frame, angles, reba_score, risk_level, fps, details)
+
+            # 錄影：寫入標註幀（攝影機來源由 recorder 依輸出 FPS 取樣，此處每幀都交出）
+            recorder = self._recorder
+            if recorder is not None and recorder.is_recording:
+                # VideoPipeline 每幀輸出新的陣列，所有權直接交給 recorder
+                recorder.write_frame(frame, owns=True)
+
+            # 送出影像到 QML VideoOutput
+            self._frame_sink.update_frame(frame)
+
+            # 更新屬性（通知延後由 _flush_notifications 合併發送）
+            self._fps = fps
+            self._frame_counter += 1
+            self._dirty |= _DIRTY_FPS | _DIRTY_COUNT | _DIRTY_COUNTER
+
+            # 發射幀處理完成信號（供 RebaBridge 等使用，不延後）
+            self.frameProcessed.emit(angles, reba_score, risk_level, fps, details)
+        finally:
+            # 通知 worker 可送下一幀
+            if self._worker is not None:
+                self._worker.frame_consumed()
+
+    def _flush_notifications(self):
+        """計時器回調：發送自上次以來累積的屬性變更通知"""
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = 0
+        if dirty & _DIRTY_FPS:
+            self.fpsChanged.emit()
+        if dirty & _DIRTY_COUNT:
+            self.frameCountChanged.emit()
+        if dirty & _DIRTY_COUNTER:
+            self.frameCounterChanged.emit()
 
     def _on_finished(self):
         """處理完成"""
+        # 停止合併計時器前送出最後一批通知，確保顯示最後一幀
+        self._notify_timer.stop()
+        self._flush_notifications()
+
         # 自動停止錄影（全程模式）
-        if self._recorder.is_recording and self._auto_recording:
+        if self._auto_recording and self._is_recording():
             path = self._recorder.stop()
             self._auto_recording = False
             self.isRecordingChanged.emit()
@@ -323,10 +410,11 @@ class VideoBridge(QObject):
 
     def cleanup(self):
         """清理資源（視窗關閉時呼叫）"""
-        if self._recorder.is_recording:
+        if self._is_recording():
             self._recorder.stop()
         if self._worker and self._worker.isRunning():
             self._controller.stop()
             self._worker.wait()
             self._worker.cleanup()
             self._worker = None
+        self._controller.close_models()
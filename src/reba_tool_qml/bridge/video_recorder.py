@@ -1,18 +1,56 @@
 #!/usr/bin/env python3
 """
 影片錄製器 (Video Recorder)
-使用 cv2.VideoWriter 將標註幀寫入 MP4 檔案。
+使用 cv2.VideoWriter 將標註幀寫入 MP4 檔案（H.264 優先，mp4v 後備）。
 寫入操作在背景線程執行，避免阻塞主線程 (GUI thread)。
 """
 
 import os
 import threading
-from queue import Queue
+import time
+from collections import deque
 
 import cv2
 import numpy as np
 
-_SENTINEL = None  # 停止信號
+_MAX_PENDING_FRAMES = 120  # 待寫入幀上限，佇列已滿時丟棄新到的幀
+_PTS_JITTER_RATIO = 0.25  # 即時取樣容許的到達抖動（佔一幀間隔的比例）
+
+
+# cv2.VideoWriter 依序嘗試的 (fourcc, 後端)：H.264 優先（OpenCV 的 FFmpeg 後端
+# 編進硬體編碼器時由其處理），mp4v 為最後後備。
+# 環境變數 REBA_VIDEO_ENCODER 可指定 fourcc（例如 mp4v）跳過探測
+_CV2_WRITER_CANDIDATES = (
+    ('avc1', cv2.CAP_FFMPEG),
+    ('H264', cv2.CAP_FFMPEG),
+    ('mp4v', cv2.CAP_ANY),
+)
+_ENCODER_ENV = 'REBA_VIDEO_ENCODER'
+_cv2_writer_choice = None  # 第一次成功開啟的 (fourcc, 後端)，之後優先使用
+
+
+def _open_cv2_writer(path: str, fps: float, size: tuple):
+    """
+    依序嘗試 fourcc 開啟 cv2.VideoWriter
+
+    Returns:
+        已開啟的 VideoWriter，皆無法開啟時為 None
+    """
+    global _cv2_writer_choice
+    override = os.environ.get(_ENCODER_ENV, '')
+    if len(override) == 4:
+        candidates = ((override, cv2.CAP_ANY),)
+    elif _cv2_writer_choice is not None:
+        candidates = (_cv2_writer_choice, *_CV2_WRITER_CANDIDATES)
+    else:
+        candidates = _CV2_WRITER_CANDIDATES
+    for fourcc, api in candidates:
+        writer = cv2.VideoWriter(path, api, cv2.VideoWriter_fourcc(*fourcc), fps, size)
+        if writer.isOpened():
+            _cv2_writer_choice = (fourcc, api)
+            return writer
+        writer.release()
+    return None
 
 
 class VideoRecorder:
@@ -23,15 +61,35 @@ class VideoRecorder:
         self._output_path = ""
         self._fps = 30.0
         self._recording = False
-        self._queue: Queue = Queue(maxsize=120)
+        # 即時取樣：依輸出 FPS 的時間格放行幀（0 = 不取樣，每幀都寫）
+        self._frame_dt = 0.0
+        self._next_pts = 0.0
+        # 單一生產者/單一消費者：deque 的 append/popleft 本身為原子操作，
+        # 主線程不取鎖，只以 Event 喚醒寫入線程
+        self._ring: deque = deque(maxlen=_MAX_PENDING_FRAMES)
+        self._wake = threading.Event()
+        self._stopping = False
         self._thread: threading.Thread | None = None
+        self._dropped_frames = 0  # 本次錄影因佇列已滿而丟棄的幀數
 
     @property
     def is_recording(self) -> bool:
         return self._recording
 
-    def start(self, output_path: str, fps: float = 30.0):
-        """開始錄影。VideoWriter 延遲到第一幀到達時建立（取得實際尺寸）"""
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    def start(self, output_path: str, fps: float = 30.0, realtime: bool = False):
+        """
+        開始錄影。VideoWriter 延遲到第一幀到達時建立（取得實際尺寸）
+
+        Args:
+            output_path: 輸出 MP4 路徑
+            fps: 影片 FPS
+            realtime: 幀以即時速率到達（攝影機）時為 True，
+                write_frame 依 fps 取樣，高於輸出幀率的多餘幀不送入編碼
+        """
         if self._recording:
             self.stop()
 
@@ -42,40 +100,63 @@ class VideoRecorder:
 
         self._output_path = output_path
         self._fps = fps if fps > 0 else 30.0
+        self._frame_dt = 1.0 / self._fps if realtime else 0.0
+        self._next_pts = 0.0
+        self._dropped_frames = 0
         self._recording = True
         self._writer = None  # 延遲建立
 
-        # 清空佇列後啟動寫入線程
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except Exception:
-                break
+        # 清空待寫入幀後啟動寫入線程
+        self._ring.clear()
+        self._wake.clear()
+        self._stopping = False
         self._thread = threading.Thread(
             target=self._write_loop, daemon=True
         )
         self._thread.start()
 
-    def write_frame(self, frame: np.ndarray):
-        """將幀送入佇列（非阻塞），由背景線程寫入磁碟"""
+    def write_frame(self, frame: np.ndarray, owns: bool = False):
+        """
+        將幀送入佇列（非阻塞），由背景線程寫入磁碟。
+
+        佇列邊界約定：預設 owns=False，先複製一份再入列，呼叫端之後可自由修改 frame；
+        確定不再修改時（VideoPipeline 每幀輸出新的陣列）傳 owns=True，
+        所有權交給 recorder，直接入列不複製。
+
+        Args:
+            frame: OpenCV BGR 影像
+            owns: frame 是否可交由 recorder 持有
+        """
         if not self._recording:
             return
-        # 佇列滿時丟棄最舊的幀，避免阻塞主線程
-        if self._queue.full():
-            try:
-                self._queue.get_nowait()
-            except Exception:
-                pass
-        self._queue.put(frame)
+        if self._frame_dt and not self._on_output_grid():
+            return
+        # 寫入跟不上時直接丟棄新幀（不複製、不擠掉已排隊的幀），不阻塞主線程
+        if len(self._ring) >= _MAX_PENDING_FRAMES:
+            self._dropped_frames += 1
+            return
+        self._ring.append(frame if owns else frame.copy())
+        self._wake.set()
+
+    def _on_output_grid(self) -> bool:
+        """即時取樣：此幀是否落在下一個輸出時間格（容許少量到達抖動）"""
+        now = time.monotonic()
+        if now < self._next_pts:
+            return False
+        # 以固定節拍推進；落後時以目前時間重新對齊
+        dt = self._frame_dt
+        self._next_pts = max(self._next_pts + dt, now + dt * (1.0 - _PTS_JITTER_RATIO))
+        return True
 
     def stop(self) -> str:
         """停止錄影，等待背景線程完成，釋放 VideoWriter，返回檔案路徑"""
         path = self._output_path
         self._recording = False
 
-        # 送入停止信號並等待線程結束
+        # 通知停止並等待線程寫完剩餘幀後結束
         if self._thread is not None and self._thread.is_alive():
-            self._queue.put(_SENTINEL)
+            self._stopping = True
+            self._wake.set()
             self._thread.join(timeout=10)
         self._thread = None
 
@@ -87,28 +168,32 @@ class VideoRecorder:
     # ========== 背景線程 ==========
 
     def _write_loop(self):
-        """背景線程：持續從佇列取幀並寫入 VideoWriter"""
+        """背景線程：被喚醒後取完所有待寫入幀並寫入 VideoWriter"""
         while True:
-            frame = self._queue.get()
-            if frame is _SENTINEL:
+            self._wake.wait()
+            # 先清除再取幀：取幀期間新到的幀會重新設定 Event，不會漏接
+            self._wake.clear()
+            while self._ring:
+                if not self._write(self._ring.popleft()):
+                    self._recording = False
+                    return
+            if self._stopping:
                 break
 
-            # 延遲建立 VideoWriter（取得第一幀的實際尺寸）
+    def _write(self, frame: np.ndarray) -> bool:
+        """寫入一幀；VideoWriter 無法開啟時回傳 False"""
+        # 延遲建立 VideoWriter（取得第一幀的實際尺寸）
+        if self._writer is None:
+            h, w = frame.shape[:2]
+            self._writer = _open_cv2_writer(self._output_path, self._fps, (w, h))
             if self._writer is None:
-                h, w = frame.shape[:2]
-                fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-                self._writer = cv2.VideoWriter(
-                    self._output_path, fourcc, self._fps, (w, h)
-                )
-                if not self._writer.isOpened():
-                    self._recording = False
-                    self._writer = None
-                    break
+                return False
 
-            # 確保是 BGR 格式（cv2.VideoWriter 預期 BGR）
-            if len(frame.shape) == 2:
-                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-            elif frame.shape[2] == 4:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        # 確保是 BGR 格式（cv2.VideoWriter 預期 BGR）
+        if len(frame.shape) == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        elif frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
 
-            self._writer.write(frame)
+        self._writer.write(frame)
+        return True
@@ -11,7 +11,7 @@ GroupBox {
     font.pixelSize: Style.Theme.groupboxFontSize
     font.bold: true
 
-    property var messages: []
+    property var model: null
 
     background: Rectangle {
         y: root.topPadding - root.bottomPadding
@@ -28,25 +28,30 @@ GroupBox {
         color: Style.Theme.text
     }
 
-    ScrollView {
+    Rectangle {
         anchors.fill: parent
-
-        TextArea {
-            id: logArea
-            readOnly: true
-            wrapMode: TextArea.Wrap
-            font.family: Style.Theme.fontFamily
-            font.pixelSize: Style.Theme.logTextFontSize
-            color: Style.Theme.logText
-            background: Rectangle {
-                color: Style.Theme.logBackground
+        color: Style.Theme.logBackground
+
+        // 模型逐筆插入，只建立新增列的 delegate，不重排整段文字
+        ListView {
+            id: logView
+            anchors.fill: parent
+            anchors.margins: 4
+            clip: true
+            model: root.model
+            ScrollBar.vertical: ScrollBar {}
+
+            delegate: Text {
+                width: logView.width
+                text: display
+                wrapMode: Text.Wrap
+                font.family: Style.Theme.fontFamily
+                font.pixelSize: Style.Theme.logTextFontSize
+                color: Style.Theme.logText
             }
-            text: root.messages.join("\n")
 
-            onTextChanged: {
-                // 自動滾動到底部
-                logArea.cursorPosition = logArea.length;
-            }
+            // 自動滾動到底部
+            onCountChanged: logView.positionViewAtEnd()
         }
     }
 }
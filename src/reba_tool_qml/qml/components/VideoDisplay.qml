@@ -1,5 +1,6 @@
 import QtQuick 2.15
 import QtQuick.Controls 2.15
+import QtMultimedia
 import "../style" as Style
 
 Rectangle {
@@ -11,16 +12,16 @@ Rectangle {
 
     property int frameCounter: 0
 
-    Image {
-        id: videoImage
+    // 供 main.qml 交給 videoBridge.setVideoSink()
+    readonly property alias videoSink: videoOutput.videoSink
+
+    // 影像由 Python 端直接寫入 videoSink（不經 image provider）
+    VideoOutput {
+        id: videoOutput
         anchors.fill: parent
         anchors.margins: Style.Theme.videoBorderWidth
-        fillMode: Image.PreserveAspectFit
-        cache: false
-        source: root.frameCounter > 0
-                ? "image://video/frame?" + root.frameCounter
-                : ""
-        asynchronous: false
+        fillMode: VideoOutput.PreserveAspectFit
+        visible: root.frameCounter > 0
     }
 
     // 提示文字（無影像時顯示）
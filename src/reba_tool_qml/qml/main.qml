@@ -89,6 +89,7 @@ ApplicationWindow {
 
         // 左側面板
         Panels.LeftPanel {
+            id: leftPanel
             Layout.fillWidth: true
             Layout.fillHeight: true
             Layout.preferredWidth: Style.Theme.leftRatio
@@ -104,7 +105,7 @@ ApplicationWindow {
             recordCount: dataBridge.recordCount
             showAngleLines: settingsBridge.showAngleLines
             showAngleValues: settingsBridge.showAngleValues
-            logMessages: dataBridge.logMessages
+            logModel: dataBridge.logModel
             hasVideoSource: videoBridge.videoSource.length > 0
             isRecording: videoBridge.isRecording
 
@@ -215,6 +216,7 @@ ApplicationWindow {
     // ========== 初始化 ==========
     Component.onCompleted: {
         Style.Theme.loadTheme(themeJson);
+        videoBridge.setVideoSink(leftPanel.videoSink);
         dataBridge.log("系統啟動完成");
         dataBridge.log("請選擇影片來源開始分析");
     }
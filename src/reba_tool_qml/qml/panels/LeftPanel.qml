@@ -20,10 +20,12 @@ ColumnLayout {
     property int recordCount: 0
     property bool showAngleLines: true
     property bool showAngleValues: true
-    property var logMessages: []
+    property var logModel: null
     property bool hasVideoSource: false
     property bool isRecording: false
 
+    readonly property alias videoSink: videoDisplay.videoSink
+
     // 信號
     signal cameraClicked()
     signal videoClicked()
@@ -39,6 +41,7 @@ ColumnLayout {
 
     // 影片顯示
     Components.VideoDisplay {
+        id: videoDisplay
         Layout.fillWidth: true
         Layout.fillHeight: true
         Layout.minimumWidth: Style.Theme.videoMinWidth
@@ -89,7 +92,7 @@ ColumnLayout {
         Components.LogPanel {
             Layout.fillWidth: true
             Layout.fillHeight: true
-            messages: root.logMessages
+            model: root.logModel
         }
 
         Components.StatsPanel {
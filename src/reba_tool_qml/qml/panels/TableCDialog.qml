@@ -15,6 +15,8 @@ Window {
 
     // tcModel 由 main.qml 傳入（不可用 tableCModel 作為 property 名，會遮蔽同名 context property）
     property var tcModel: null
+    // 分數變化時整張表只跨語言傳遞一次，各 cell 從此 JS 陣列取值
+    readonly property var cells: tcModel ? tcModel.cells : []
 
     // 定位到主視窗右側（垂直置中），超出螢幕則改左側
     function positionToRight(winX, winY, winW, winH, screenRight, screenLeft, screenTop, screenBottom) {
@@ -58,42 +60,20 @@ Window {
                 Rectangle {
                     property int row: Math.floor(index / 13)
                     property int col: index % 13
-                    // 引用 scoreA/scoreB 建立響應式依賴，分數變化時所有 binding 重新求值
-                    property int _sa: root.tcModel ? root.tcModel.scoreA : 0
-                    property int _sb: root.tcModel ? root.tcModel.scoreB : 0
+                    property var cell: root.cells.length ? root.cells[row][col] : null
 
                     Layout.fillWidth: true
                     Layout.fillHeight: true
 
-                    color: {
-                        var dep = _sa + _sb;
-                        if (!root.tcModel) return Style.Theme.surface;
-                        return root.tcModel.cellBgColor(row, col) || Style.Theme.surface;
-                    }
+                    color: cell ? cell.bgColor : Style.Theme.surface
 
                     Text {
                         anchors.centerIn: parent
-                        text: {
-                            var dep = parent._sa + parent._sb;
-                            if (!root.tcModel) return "";
-                            return root.tcModel.cellText(row, col);
-                        }
+                        text: parent.cell ? parent.cell.text : ""
                         font.family: Style.Theme.fontFamily
-                        font.pixelSize: {
-                            var dep = parent._sa + parent._sb;
-                            if (!root.tcModel) return 10;
-                            return root.tcModel.cellFontSize(row, col);
-                        }
-                        font.bold: {
-                            var dep = parent._sa + parent._sb;
-                            if (!root.tcModel) return false;
-                            return root.tcModel.cellBold(row, col);
-                        }
-                        color: {
-                            var dep = parent._sa + parent._sb;
-                            if (!root.tcModel) return Style.Theme.text;
-                            return root.tcModel.cellFgColor(row, col) || Style.Theme.text;
-                        }
+                        font.pixelSize: parent.cell ? parent.cell.fontSize : 10
+                        font.bold: parent.cell ? parent.cell.bold : false
+                        color: parent.cell ? parent.cell.fgColor : Style.Theme.text
                     }
                 }
             }
@@ -2,23 +2,23 @@
 """
 資料橋接 (Data Bridge)
 包裝 DataLogger 的匯出/統計功能。
-提供日誌訊息列表給 QML。
+提供日誌訊息模型給 QML。
 """
 
-from datetime import datetime
 from PySide6.QtCore import QObject, Property, Signal, Slot
 
+from bridge.log_model import LogModel
+
 
 class DataBridge(QObject):
     """QML↔DataLogger 橋接"""
 
     recordCountChanged = Signal()
-    logMessagesChanged = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._controller = None
-        self._log_messages = []
+        self._log_model = LogModel(self)
 
     def set_controller(self, controller):
         """設定 VideoController 引用"""
@@ -32,18 +32,17 @@ class DataBridge(QObject):
             return self._controller.data_logger.get_buffer_size()
         return 0
 
-    @Property(list, notify=logMessagesChanged)
-    def logMessages(self):
-        return self._log_messages
+    @Property(QObject, constant=True)
+    def logModel(self):
+        """日誌列表模型（固定容量，增量插入）"""
+        return self._log_model
 
     # ========== Slots ==========
 
     @Slot(str)
     def log(self, message):
         """添加日誌訊息"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self._log_messages.append(f"[{timestamp}] {message}")
-        self.logMessagesChanged.emit()
+        self._log_model.append(message)
 
     @Slot(str, result=str)
     def saveCsv(self, path):
@@ -18,6 +18,7 @@ class SettingsBridge(QObject):
     showAngleValuesChanged = Signal()
     showSkeletonChanged = Signal()
     dataLockedChanged = Signal()
+    autoRecordChanged = Signal()
 
     # 參數變更通知（VideoBridge 監聽此信號）
     parametersChanged = Signal(str, float, str)
@@ -32,6 +33,7 @@ class SettingsBridge(QObject):
         self._show_angle_values = True
         self._show_skeleton = True
         self._data_locked = False
+        self._auto_record = False  # 開始處理時自動全程錄影（預設關閉）
 
     # ========== Properties ==========
 
@@ -44,7 +46,7 @@ class SettingsBridge(QObject):
         if self._side != value:
             self._side = value
             self.sideChanged.emit()
-            self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+            self._emit_parameters()
 
     @Property(float, notify=loadWeightChanged)
     def loadWeight(self):
@@ -55,7 +57,7 @@ class SettingsBridge(QObject):
         if self._load_weight != value:
             self._load_weight = value
             self.loadWeightChanged.emit()
-            self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+            self._emit_parameters()
 
     @Property(str, notify=couplingChanged)
     def coupling(self):
@@ -66,7 +68,7 @@ class SettingsBridge(QObject):
         if self._coupling != value:
             self._coupling = value
             self.couplingChanged.emit()
-            self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+            self._emit_parameters()
 
     @Property(bool, notify=showAngleLinesChanged)
     def showAngleLines(self):
@@ -77,8 +79,7 @@ class SettingsBridge(QObject):
         if self._show_angle_lines != value:
             self._show_angle_lines = value
             self.showAngleLinesChanged.emit()
-            self.displayOptionsChanged.emit(
-                self._show_angle_lines, self._show_angle_values, self._show_skeleton)
+            self._emit_display_options()
 
     @Property(bool, notify=showAngleValuesChanged)
     def showAngleValues(self):
@@ -89,8 +90,7 @@ class SettingsBridge(QObject):
         if self._show_angle_values != value:
             self._show_angle_values = value
             self.showAngleValuesChanged.emit()
-            self.displayOptionsChanged.emit(
-                self._show_angle_lines, self._show_angle_values, self._show_skeleton)
+            self._emit_display_options()
 
     @Property(bool, notify=showSkeletonChanged)
     def showSkeleton(self):
@@ -101,8 +101,7 @@ class SettingsBridge(QObject):
         if self._show_skeleton != value:
             self._show_skeleton = value
             self.showSkeletonChanged.emit()
-            self.displayOptionsChanged.emit(
-                self._show_angle_lines, self._show_angle_values, self._show_skeleton)
+            self._emit_display_options()
 
     @Property(bool, notify=dataLockedChanged)
     def dataLocked(self):
@@ -114,6 +113,16 @@ class SettingsBridge(QObject):
             self._data_locked = value
             self.dataLockedChanged.emit()
 
+    @Property(bool, notify=autoRecordChanged)
+    def autoRecord(self):
+        return self._auto_record
+
+    @autoRecord.setter
+    def autoRecord(self, value):
+        if self._auto_record != value:
+            self._auto_record = value
+            self.autoRecordChanged.emit()
+
     # ========== Slots ==========
 
     @Slot(str)
@@ -143,3 +152,18 @@ class SettingsBridge(QObject):
     @Slot(bool)
     def setDataLocked(self, value):
         self.dataLocked = value
+
+    @Slot(bool)
+    def setAutoRecord(self, value):
+        self.autoRecord = value
+
+    # ========== 內部方法 ==========
+
+    def _emit_parameters(self):
+        """發送目前的評分參數（side/loadWeight/coupling 共用）"""
+        self.parametersChanged.emit(self._side, self._load_weight, self._coupling)
+
+    def _emit_display_options(self):
+        """發送目前的顯示選項"""
+        self.displayOptionsChanged.emit(
+            self._show_angle_lines, self._show_angle_values, self._show_skeleton)
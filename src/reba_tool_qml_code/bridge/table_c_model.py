@@ -19,6 +19,7 @@ class TableCModel(QAbstractTableModel):
 
     scoreAChanged = Signal()
     scoreBChanged = Signal()
+    cellsChanged = Signal()
 
     TABLE_C_DATA = [[1,  1,  1,  2,  3,  3,  4,  5,  6,  7,  7,  7],
                     [1,  2,  2,  3,  4,  4,  5,  6,  6,  7,  7,  8],
@@ -33,10 +34,20 @@ class TableCModel(QAbstractTableModel):
                     [11, 11, 11, 11, 12, 12, 12, 12, 12, 12, 12, 12],
                     [12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12]]
 
+    # 分數 → 顏色查表（索引 0-15）：1 / 2-3 / 4-7 / 8-10 / 11+
+    _SCORE_COLOR_LUT = (["#059669", "#047857"]
+                        + ["#059669"] * 2
+                        + ["#fbbf24"] * 4
+                        + ["#f43f5e"] * 3
+                        + ["#ff0000"] * 5)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._score_a = None
         self._score_b = None
+        self._cell_cache = []
+        self._cells_snapshot = []
+        self._rebuild_cache()
 
     def roleNames(self):
         return {
@@ -56,10 +67,28 @@ class TableCModel(QAbstractTableModel):
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
-
-        row = index.row()
-        col = index.column()
-
+        return self._cell_cache[index.row()][index.column()].get(role)
+
+    def _rebuild_cache(self):
+        """依目前分數預先計算 13x13 各角色值，data() 只做查表"""
+        self._cell_cache = [
+            [self._compute_cell(row, col) for col in range(13)]
+            for row in range(13)
+        ]
+        # QML 用快照：一次傳遞整張表，取代逐格 Slot 呼叫
+        self._cells_snapshot = [
+            [{
+                'text': cell[Qt.DisplayRole],
+                'bgColor': cell[self.BackgroundColorRole],
+                'fgColor': cell[self.ForegroundColorRole],
+                'bold': cell[self.FontBoldRole],
+                'fontSize': cell[self.FontSizeRole],
+            } for cell in cache_row]
+            for cache_row in self._cell_cache
+        ]
+
+    def _compute_cell(self, row, col):
+        """計算單一 cell 的所有角色值"""
         is_header_row = (row == 0)
         is_header_col = (col == 0)
         is_highlighted_row = (
@@ -67,105 +96,83 @@ class TableCModel(QAbstractTableModel):
         is_highlighted_col = (
             self._score_b is not None and col == self._score_b)
         is_intersection = is_highlighted_row and is_highlighted_col
+        is_target = is_intersection and not is_header_row and not is_header_col
+        is_header_highlight = (
+            (is_header_row and is_highlighted_col)
+            or (is_header_col and is_highlighted_row))
 
         # === Display ===
-        if role == Qt.DisplayRole:
-            if row == 0 and col == 0:
-                return "Score A \\ B"
-            if row == 0:
-                return str(col)
-            if col == 0:
-                return str(row)
-            return str(self.TABLE_C_DATA[row - 1][col - 1])
+        if row == 0 and col == 0:
+            display = "Score A \\ B"
+        elif row == 0:
+            display = str(col)
+        elif col == 0:
+            display = str(row)
+        else:
+            display = str(self.TABLE_C_DATA[row - 1][col - 1])
 
         # === Background Color ===
-        if role == self.BackgroundColorRole:
-            if is_intersection and not is_header_row and not is_header_col:
-                return "#00f2ff"
-            if is_header_row or is_header_col:
-                if is_intersection:
-                    return "#0a3d42"
-                if (is_header_row and is_highlighted_col) or (is_header_col and is_highlighted_row):
-                    return "#0a3d42"
-                return "#1a2235"
-            if is_highlighted_row or is_highlighted_col:
-                return "#0a2a3a"
+        if is_target:
+            bg_color = "#00f2ff"
+        elif is_header_row or is_header_col:
+            if is_intersection or is_header_highlight:
+                bg_color = "#0a3d42"
+            else:
+                bg_color = "#1a2235"
+        elif is_highlighted_row or is_highlighted_col:
+            bg_color = "#0a2a3a"
+        else:
             # 一般資料格顏色
-            value = self.TABLE_C_DATA[row - 1][col - 1]
-            return self._get_score_color(value)
+            bg_color = self._get_score_color(self.TABLE_C_DATA[row - 1][col - 1])
 
         # === Foreground Color ===
-        if role == self.ForegroundColorRole:
-            if is_intersection and not is_header_row and not is_header_col:
-                return "#0a0f1d"
-            if (is_header_row and is_highlighted_col) or (is_header_col and is_highlighted_row):
-                return "#00f2ff"
-            return "#e2e8f0"
-
-        # === Font Bold ===
-        if role == self.FontBoldRole:
-            if is_header_row or is_header_col:
-                return True
-            return is_highlighted_row or is_highlighted_col
-
-        # === Font Size ===
-        if role == self.FontSizeRole:
-            if is_intersection and not is_header_row and not is_header_col:
-                return 16
-            return 14
-
-        return None
-
-    @staticmethod
-    def _get_score_color(score):
-        """根據分數取得對應顏色"""
-        if score == 1:
-            return "#047857"
-        elif score <= 3:
-            return "#059669"
-        elif score <= 7:
-            return "#fbbf24"
-        elif score <= 10:
-            return "#f43f5e"
+        if is_target:
+            fg_color = "#0a0f1d"
+        elif is_header_highlight:
+            fg_color = "#00f2ff"
         else:
-            return "#ff0000"
+            fg_color = "#e2e8f0"
+
+        return {
+            Qt.DisplayRole: display,
+            self.BackgroundColorRole: bg_color,
+            self.ForegroundColorRole: fg_color,
+            self.FontBoldRole: (is_header_row or is_header_col
+                                or is_highlighted_row or is_highlighted_col),
+            self.FontSizeRole: 16 if is_target else 14,
+        }
+
+    @classmethod
+    def _get_score_color(cls, score):
+        """根據分數取得對應顏色"""
+        return cls._SCORE_COLOR_LUT[min(score, 15)]
 
     # ========== QML 可呼叫的 Cell 資料 Slots ==========
 
     @Slot(int, int, result=str)
     def cellText(self, row, col):
         """QML 用：取得 cell 顯示文字"""
-        idx = self.index(row, col)
-        v = self.data(idx, Qt.DisplayRole)
-        return v if v else ""
+        return self._cell_cache[row][col][Qt.DisplayRole]
 
     @Slot(int, int, result=str)
     def cellBgColor(self, row, col):
         """QML 用：取得 cell 背景色"""
-        idx = self.index(row, col)
-        v = self.data(idx, self.BackgroundColorRole)
-        return v if v else ""
+        return self._cell_cache[row][col][self.BackgroundColorRole]
 
     @Slot(int, int, result=str)
     def cellFgColor(self, row, col):
         """QML 用：取得 cell 文字色"""
-        idx = self.index(row, col)
-        v = self.data(idx, self.ForegroundColorRole)
-        return v if v else ""
+        return self._cell_cache[row][col][self.ForegroundColorRole]
 
     @Slot(int, int, result=bool)
     def cellBold(self, row, col):
         """QML 用：取得 cell 是否粗體"""
-        idx = self.index(row, col)
-        v = self.data(idx, self.FontBoldRole)
-        return bool(v) if v else False
+        return self._cell_cache[row][col][self.FontBoldRole]
 
     @Slot(int, int, result=int)
     def cellFontSize(self, row, col):
         """QML 用：取得 cell 字號"""
-        idx = self.index(row, col)
-        v = self.data(idx, self.FontSizeRole)
-        return v if v else 16
+        return self._cell_cache[row][col][self.FontSizeRole]
 
     # ========== Score Properties ==========
 
@@ -177,6 +184,11 @@ class TableCModel(QAbstractTableModel):
     def scoreB(self):
         return self._score_b if self._score_b is not None else 0
 
+    @Property('QVariantList', notify=cellsChanged)
+    def cells(self):
+        """13x13 cell 快照，每格含 text/bgColor/fgColor/bold/fontSize"""
+        return self._cells_snapshot
+
     # ========== Slots ==========
 
     @Slot(int, int)
@@ -184,9 +196,21 @@ class TableCModel(QAbstractTableModel):
         """更新分數並重新高亮"""
         sa = max(1, min(12, score_a)) if score_a else None
         sb = max(1, min(12, score_b)) if score_b else None
+        prev_a, prev_b = self._score_a, self._score_b
+        if (sa, sb) == (prev_a, prev_b):
+            return
         self._score_a = sa
         self._score_b = sb
-        self.beginResetModel()
-        self.endResetModel()
+        self._rebuild_cache()
+
+        # 只通知新舊強調列/欄，不重建整個 view
+        roles = [Qt.DisplayRole, self.BackgroundColorRole, self.ForegroundColorRole,
+                 self.FontBoldRole, self.FontSizeRole]
+        last = 12
+        for row in {prev_a, sa} - {None}:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last), roles)
+        for col in {prev_b, sb} - {None}:
+            self.dataChanged.emit(self.index(0, col), self.index(last, col), roles)
         self.scoreAChanged.emit()
         self.scoreBChanged.emit()
+        self.cellsChanged.emit()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+影像輸出 (Video Frame Sink)
+將 OpenCV BGR numpy frame 直接寫入 QVideoFrame，交給 QML VideoOutput 的 QVideoSink 顯示。
+QML 端：VideoOutput 建立完成後呼叫 videoBridge.setVideoSink(videoOutput.videoSink)
+"""
+
+import numpy as np
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage
+from PySide6.QtMultimedia import QVideoFrame, QVideoFrameFormat
+
+
+class VideoFrameSink:
+    """OpenCV frame → QVideoSink（每幀一次寫入映射緩衝區，不經中間 QImage）"""
+
+    def __init__(self):
+        self._sink = None
+        self._format = None
+        self._format_size = None
+        # 最新一幀（保存影像用）；管線每幀產生新陣列且發送後不再修改，可直接持有
+        self._frame = None
+
+    def set_sink(self, sink):
+        """設定 QML VideoOutput 的 QVideoSink"""
+        self._sink = sink
+
+    def update_frame(self, cv_frame: np.ndarray):
+        """
+        更新當前影像幀（由 VideoBridge 在主線程呼叫）
+
+        Args:
+            cv_frame: OpenCV BGR numpy 陣列
+        """
+        if cv_frame is None or cv_frame.size == 0:
+            return
+        self._frame = cv_frame
+        if self._sink is None:
+            return
+
+        h, w = cv_frame.shape[:2]
+        if self._format_size != (w, h):
+            self._format = QVideoFrameFormat(
+                QSize(w, h), QVideoFrameFormat.PixelFormat.Format_BGRX8888
+            )
+            self._format_size = (w, h)
+
+        video_frame = QVideoFrame(self._format)
+        if not video_frame.map(QVideoFrame.MapMode.WriteOnly):
+            return
+        try:
+            # 以映射平面為底建立 (h, w, 4) 視圖，BGR 直接寫入前三個通道（X 通道忽略）
+            plane = np.ndarray(
+                (h, w, 4), dtype=np.uint8, buffer=video_frame.bits(0),
+                strides=(video_frame.bytesPerLine(0), 4, 1)
+            )
+            plane[..., :3] = cv_frame
+        finally:
+            video_frame.unmap()
+        self._sink.setVideoFrame(video_frame)
+
+    def get_current_image(self):
+        """
+        取得當前影像幀的副本
+
+        Returns:
+            QImage: 當前影像副本，若無影像則回傳 None
+        """
+        if self._frame is None:
+            return None
+        frame = np.ascontiguousarray(self._frame)
+        h, w = frame.shape[:2]
+        # QImage 只包裝 numpy 緩衝區，copy() 後才與陣列脫鉤
+        return QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888).copy()
@@ -3,6 +3,10 @@
 輸出錄製器 (Video Recorder)
 將標註幀寫入輸出目錄，包含 MP4 影片、每幀 JPG 圖片、CSV 資料。
 所有磁碟 I/O 在背景線程執行，避免阻塞主線程 (GUI thread)。
+MP4 優先交給 ffmpeg 子行程編碼（可用時使用硬體編碼器），
+找不到 ffmpeg 時改用 PyAV（若已安裝）行程內多線程編碼，
+最後才退回 cv2.VideoWriter。
+影片輸出失敗時只停用 MP4，JPG/CSV 照常寫入，原因由 video_error 回報。
 
 輸出目錄結構：
   {output_dir}/
@@ -14,16 +18,79 @@
     └── reba_data.csv
 """
 
-import csv
+import functools
 import os
+import shutil
+import subprocess
+import tempfile
 import threading
-from datetime import datetime
-from queue import Queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 
 import cv2
 import numpy as np
 
-_SENTINEL = None  # 停止信號
+# 選用相依：PyAV（內建 libav，免系統 ffmpeg 即可在行程內編碼 H.264）
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+_MAX_PENDING_FRAMES = 120  # 待寫入幀上限，佇列已滿時丟棄新到的幀
+_PTS_JITTER_RATIO = 0.25  # 即時取樣容許的到達抖動（佔一幀間隔的比例）
+# JPG 編碼線程數（libjpeg 編碼期間釋放 GIL，可與 MP4 編碼並行）
+_JPG_WORKERS = min(4, os.cpu_count() or 1)
+_MAX_PENDING_JPG = _JPG_WORKERS * 2  # 未完成的 JPG 工作上限，超過時寫入線程等待最舊的完成
+_JPG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 90]
+
+_FFMPEG_BINARY = shutil.which('ffmpeg')
+# 依序嘗試的 H.264 編碼器：硬體優先，libx264 為軟體後備
+_ENCODER_CANDIDATES = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox', 'libx264')
+_ENCODER_EXTRA_ARGS = {
+    'libx264': ['-preset', 'ultrafast', '-tune', 'zerolatency'],
+}
+# Windows 下不跳出 ffmpeg 主控台視窗
+_POPEN_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+_FFMPEG_LOG_TAIL_LINES = 3  # 影片輸出失敗時回報的 ffmpeg stderr 末尾行數
+
+
+# cv2.VideoWriter 依序嘗試的 (fourcc, 後端)：H.264 優先（OpenCV 的 FFmpeg 後端
+# 編進硬體編碼器時由其處理），mp4v 為最後後備。
+# 環境變數 REBA_VIDEO_ENCODER 可指定 fourcc（例如 mp4v）跳過探測
+_CV2_WRITER_CANDIDATES = (
+    ('avc1', cv2.CAP_FFMPEG),
+    ('H264', cv2.CAP_FFMPEG),
+    ('mp4v', cv2.CAP_ANY),
+)
+_ENCODER_ENV = 'REBA_VIDEO_ENCODER'
+_cv2_writer_choice = None  # 第一次成功開啟的 (fourcc, 後端)，之後優先使用
+
+
+def _open_cv2_writer(path: str, fps: float, size: tuple):
+    """
+    依序嘗試 fourcc 開啟 cv2.VideoWriter
+
+    Returns:
+        已開啟的 VideoWriter，皆無法開啟時為 None
+    """
+    global _cv2_writer_choice
+    override = os.environ.get(_ENCODER_ENV, '')
+    if len(override) == 4:
+        candidates = ((override, cv2.CAP_ANY),)
+    elif _cv2_writer_choice is not None:
+        candidates = (_cv2_writer_choice, *_CV2_WRITER_CANDIDATES)
+    else:
+        candidates = _CV2_WRITER_CANDIDATES
+    for fourcc, api in candidates:
+        writer = cv2.VideoWriter(path, api, cv2.VideoWriter_fourcc(*fourcc), fps, size)
+        if writer.isOpened():
+            _cv2_writer_choice = (fourcc, api)
+            return writer
+        writer.release()
+    return None
 
 # CSV 欄位定義
 _CSV_FIELDS = [
@@ -32,24 +99,102 @@ _CSV_FIELDS = [
     'forearm_angle', 'wrist_angle', 'leg_angle',
     'reba_score', 'risk_level',
 ]
+_CSV_LINE_END = '\r\n'  # 同 csv.writer 預設的換行
+
+
+def _write_jpg(img_path: str, frame: np.ndarray) -> bool:
+    """
+    編碼 JPG 並寫檔（JPG 線程池工作）。
+    以 imencode 取得記憶體緩衝區後由 Python 寫出，
+    不經 cv2.imwrite 的檔名處理（Windows 上非 ASCII 路徑亦可寫入）。
+    寫檔失敗（磁碟已滿、權限等）只略過此張，不影響 MP4 與 CSV
+    """
+    ok, encoded = cv2.imencode('.jpg', frame, _JPG_PARAMS)
+    if not ok:
+        return False
+    try:
+        with open(img_path, 'wb') as f:
+            f.write(encoded.data)
+    except OSError:
+        return False
+    return True
+
+
+def _csv_field(value) -> str:
+    """CSV 欄位文字：含分隔字元時才加引號（同 csv 模組的 QUOTE_MINIMAL）"""
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_encoder():
+    """
+    找出實際可用的 H.264 編碼器（結果快取，只探測一次）。
+    以極短的測試編碼確認，而非只看 `ffmpeg -encoders`：
+    編進 ffmpeg 的硬體編碼器不代表本機有對應硬體。
+
+    Returns:
+        編碼器名稱，無 ffmpeg 或皆不可用時為 None
+    """
+    if _FFMPEG_BINARY is None:
+        return None
+    for encoder in _ENCODER_CANDIDATES:
+        try:
+            result = subprocess.run(
+                [_FFMPEG_BINARY, '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+                 '-c:v', encoder, '-f', 'null', '-'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=10, creationflags=_POPEN_FLAGS
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            return encoder
+    return None
 
 
 class VideoRecorder:
     """輸出目錄管理器，背景線程寫入 MP4 + JPG + CSV"""
 
     def __init__(self):
-        self._writer = None
+        self._writer = None  # cv2.VideoWriter（無 ffmpeg 時的後備）
+        self._proc = None  # ffmpeg 子行程
+        self._ffmpeg_log = None  # ffmpeg stderr 暫存檔（失敗時讀取原因）
+        self._av_container = None  # PyAV 輸出容器
+        self._av_stream = None
         self._output_dir = ""
         self._video_path = ""
         self._image_dir = ""
+        self._img_prefix = ""  # 每幀 JPG 路徑前綴（{image_dir}/frame_）
         self._csv_path = ""
         self._fps = 30.0
         self._recording = False
         self._frame_id = 0
-        self._queue: Queue = Queue(maxsize=120)
+        # 即時取樣：依輸出 FPS 的時間格放行幀（0 = 不取樣，每幀都寫）
+        self._frame_dt = 0.0
+        self._next_pts = 0.0
+        # 待寫入幀（write_frame 於滿時丟棄新幀，maxlen 僅為上限保險）；單一生產者/單一消費者下
+        # append/popleft 本身為原子操作，主線程不取鎖，只以 Event 喚醒寫入線程
+        self._pending: deque = deque(maxlen=_MAX_PENDING_FRAMES)
+        self._wake = threading.Event()
+        self._stopping = False
+        # 非連續/非 uint8 幀的暫存緩衝區（寫入線程專用，首次需要時配置後重複使用）
+        self._scratch: np.ndarray | None = None
         self._thread: threading.Thread | None = None
+        self._dropped_frames = 0  # 本次錄製因佇列已滿而丟棄的幀數
+        # 影片輸出失敗後停用 MP4（JPG/CSV 照常寫入），原因留給 VideoBridge 回報
+        self._video_failed = False
+        self._video_error = ""
+        # JPG 編碼線程池（start 時建立）與尚未完成的工作
+        self._jpg_pool: ThreadPoolExecutor | None = None
+        self._jpg_futures: deque = deque()
         self._csv_file = None
-        self._csv_writer = None
+        # CSV datetime 欄位的秒級字串快取（寫入線程專用，同一秒內只格式化毫秒）
+        self._dt_second = None
+        self._dt_text = ""
 
     @property
     def is_recording(self) -> bool:
@@ -59,13 +204,24 @@ class VideoRecorder:
     def output_dir(self) -> str:
         return self._output_dir
 
-    def start(self, output_dir: str, fps: float = 30.0):
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    @property
+    def video_error(self) -> str:
+        """本次錄製的影片輸出錯誤訊息（無錯誤時為空字串）"""
+        return self._video_error
+
+    def start(self, output_dir: str, fps: float = 30.0, realtime: bool = False):
         """
         開始錄製到指定目錄。
 
         Args:
             output_dir: 輸出目錄路徑（完整路徑）
             fps: 影片 FPS
+            realtime: 幀以即時速率到達（攝影機）時為 True，
+                write_frame 依 fps 取樣，高於輸出幀率的多餘幀不寫入（MP4/JPG/CSV 一致）
         """
         if self._recording:
             self.stop()
@@ -73,137 +229,340 @@ class VideoRecorder:
         self._output_dir = output_dir
         self._video_path = os.path.join(output_dir, "video.mp4")
         self._image_dir = os.path.join(output_dir, "image")
+        self._img_prefix = os.path.join(self._image_dir, "frame_")
         self._csv_path = os.path.join(output_dir, "reba_data.csv")
         self._fps = fps if fps > 0 else 30.0
+        self._frame_dt = 1.0 / self._fps if realtime else 0.0
+        self._next_pts = 0.0
         self._frame_id = 0
+        self._dropped_frames = 0
+        self._video_failed = False
+        self._video_error = ""
         self._recording = True
         self._writer = None  # 延遲建立
+        self._proc = None
+        self._av_container = None
+        self._av_stream = None
 
         # 建立目錄結構
         os.makedirs(self._image_dir, exist_ok=True)
 
         # 開啟 CSV 串流寫入
         self._csv_file = open(self._csv_path, 'w', newline='', encoding='utf-8-sig')
-        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=_CSV_FIELDS)
-        self._csv_writer.writeheader()
+        self._csv_file.write(','.join(_CSV_FIELDS) + _CSV_LINE_END)
 
-        # 清空佇列後啟動寫入線程
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except Exception:
-                break
+        self._jpg_pool = ThreadPoolExecutor(
+            max_workers=_JPG_WORKERS, thread_name_prefix="reba-jpg"
+        )
+        self._jpg_futures.clear()
+
+        # 清空待寫入幀後啟動寫入線程
+        self._pending.clear()
+        self._wake.clear()
+        self._stopping = False
         self._thread = threading.Thread(
             target=self._write_loop, daemon=True
         )
         self._thread.start()
 
-    def write_frame(self, frame: np.ndarray, frame_data: dict = None):
+    def write_frame(self, frame: np.ndarray, frame_data: dict = None, owns: bool = False):
         """
         將幀送入佇列（非阻塞），由背景線程寫入磁碟。
 
+        佇列邊界約定：frame 為 3 通道 BGR 陣列（VideoPipeline 的輸出為 uint8、C 連續）。
+        預設 owns=False，先複製一份再入列，呼叫端之後可自由修改 frame；
+        確定不再修改時傳 owns=True，所有權交給 recorder，直接入列不複製。
+        少數不符合格式的幀由寫入線程複製到重複使用的暫存緩衝區。
+
         Args:
             frame: OpenCV BGR 影像
             frame_data: 該幀的分析資料 dict，包含 angles, reba_score, risk_level 等
+            owns: frame 是否可交由 recorder 持有
         """
         if not self._recording:
             return
+        if self._frame_dt and not self._on_output_grid():
+            return
+        # 寫入跟不上時直接丟棄新幀（不複製、不建立項目），不阻塞主線程
+        if len(self._pending) >= _MAX_PENDING_FRAMES:
+            self._dropped_frames += 1
+            return
         self._frame_id += 1
         item = {
-            'frame': frame.copy(),
+            'frame': frame if owns else frame.copy(),
             'frame_id': self._frame_id,
             'frame_data': frame_data,
         }
-        # 佇列滿時丟棄最舊的項目，避免阻塞主線程
-        if self._queue.full():
-            try:
-                self._queue.get_nowait()
-            except Exception:
-                pass
-        self._queue.put(item)
+        self._pending.append(item)
+        self._wake.set()
+
+    def _on_output_grid(self) -> bool:
+        """即時取樣：此幀是否落在下一個輸出時間格（容許少量到達抖動）"""
+        now = time.monotonic()
+        if now < self._next_pts:
+            return False
+        # 以固定節拍推進；落後時以目前時間重新對齊
+        dt = self._frame_dt
+        self._next_pts = max(self._next_pts + dt, now + dt * (1.0 - _PTS_JITTER_RATIO))
+        return True
 
     def stop(self) -> str:
         """停止錄製，等待背景線程完成，釋放資源，返回輸出目錄路徑"""
         out_dir = self._output_dir
         self._recording = False
 
-        # 送入停止信號並等待線程結束
+        # 通知停止並等待線程寫完剩餘幀後結束
         if self._thread is not None and self._thread.is_alive():
-            self._queue.put(_SENTINEL)
+            self._stopping = True
+            self._wake.set()
             self._thread.join(timeout=30)
         self._thread = None
 
-        if self._writer is not None:
-            self._writer.release()
-            self._writer = None
+        # 等待所有 JPG 寫完
+        if self._jpg_pool is not None:
+            self._jpg_pool.shutdown(wait=True)
+            self._jpg_pool = None
+        self._jpg_futures.clear()
+
+        detail = self._close_video()
+        if detail and not self._video_error:
+            self._video_error = f"ffmpeg 編碼失敗（{detail}）"
 
         if self._csv_file is not None:
-            self._csv_file.close()
+            self._csv_file.close()  # close() 寫出緩衝區內剩餘的列
             self._csv_file = None
-            self._csv_writer = None
 
         return out_dir
 
     # ========== 背景線程 ==========
 
     def _write_loop(self):
-        """背景線程：持續從佇列取項目並寫入 MP4 + JPG + CSV"""
+        """背景線程：被喚醒後取完所有待寫入幀並寫入 MP4 + JPG + CSV"""
         while True:
-            item = self._queue.get()
-            if item is _SENTINEL:
-                break
-
-            frame = item['frame']
-            frame_id = item['frame_id']
-            frame_data = item.get('frame_data')
-
-            # 確保是 BGR 格式
-            if len(frame.shape) == 2:
-                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-            elif frame.shape[2] == 4:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-
-            # 1. 寫入 MP4
-            if self._writer is None:
+            self._wake.wait()
+            # 先清除再取幀：取幀期間新到的幀會重新設定 Event，不會漏接
+            self._wake.clear()
+            while self._pending:
+                self._write_item(self._pending.popleft())
+            if self._stopping:
+                break  # 已要求停止且沒有剩餘幀
+
+    def _write_item(self, item: dict):
+        """寫入一筆待寫入幀；影片輸出失敗時停用 MP4，JPG 與 CSV 照常寫入"""
+        frame = self._staged(item['frame'])
+        frame_id = item['frame_id']
+        frame_data = item.get('frame_data')
+
+        # 1. 寫入 MP4
+        if not self._video_failed:
+            if (self._writer is None and self._proc is None
+                    and self._av_container is None):
                 h, w = frame.shape[:2]
-                fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-                self._writer = cv2.VideoWriter(
-                    self._video_path, fourcc, self._fps, (w, h)
+                if not self._open_video(w, h):
+                    self._fail_video("無法開啟影片輸出")
+            if not self._video_failed and not self._write_video(frame):
+                backend = 'ffmpeg' if self._proc is not None else 'PyAV'
+                self._fail_video(f"影片寫入失敗（{backend}）")
+
+        # 2. 寫入 JPG 圖片（交給線程池編碼，MP4 仍在本線程依序寫入）
+        self._submit_jpg(f"{self._img_prefix}{frame_id:06d}.jpg", frame)
+
+        # 3. 寫入 CSV 行
+        if frame_data and self._csv_file is not None:
+            ts = frame_data.get('timestamp', time.time())
+            angles = frame_data.get('angles', {})
+            fmt = self._fmt_angle
+            # 欄位順序同 _CSV_FIELDS；數值欄位不含分隔字元，直接組成一行，
+            # 只有外部傳入的文字欄位經 _csv_field 處理引號。
+            # 不逐行 flush，交由檔案緩衝於 stop() 時寫出
+            line = (
+                f"{frame_id},{ts:.3f},{self._format_datetime(ts)},"
+                f"{fmt(angles.get('neck'))},{fmt(angles.get('trunk'))},"
+                f"{fmt(angles.get('upper_arm'))},{fmt(angles.get('forearm'))},"
+                f"{fmt(angles.get('wrist'))},{fmt(angles.get('leg'))},"
+                f"{_csv_field(frame_data.get('reba_score', ''))},"
+                f"{_csv_field(frame_data.get('risk_level', ''))}{_CSV_LINE_END}"
+            )
+            try:
+                self._csv_file.write(line)
+            except Exception:
+                pass
+
+    def _submit_jpg(self, img_path: str, frame: np.ndarray):
+        """送出一張 JPG 編碼工作；未完成的工作過多時先等待最舊的完成"""
+        futures = self._jpg_futures
+        while futures and futures[0].done():
+            futures.popleft()
+        if len(futures) >= _MAX_PENDING_JPG:
+            # 只等待完成，不重新拋出工作中的例外，避免單張 JPG 失敗終止寫入線程
+            futures.popleft().exception()
+        # 暫存緩衝區會被下一幀覆寫，交給線程池前需獨立一份
+        if frame is self._scratch:
+            frame = frame.copy()
+        futures.append(self._jpg_pool.submit(_write_jpg, img_path, frame))
+
+    def _staged(self, frame: np.ndarray) -> np.ndarray:
+        """
+        回傳可直接以 memoryview 寫出的 uint8 C 連續幀：
+        已符合時原樣回傳（零複製），否則 np.copyto 到重複使用的暫存緩衝區
+        """
+        if frame.dtype == np.uint8 and frame.flags.c_contiguous:
+            return frame
+        scratch = self._scratch
+        if scratch is None or scratch.shape != frame.shape:
+            scratch = self._scratch = np.empty(frame.shape, dtype=np.uint8)
+        np.copyto(scratch, frame, casting='unsafe')
+        return scratch
+
+    # ========== MP4 輸出 ==========
+
+    def _open_video(self, w: int, h: int) -> bool:
+        """
+        依第一幀尺寸開啟影片輸出。
+        順序：ffmpeg 管線（可用硬體編碼器）→ PyAV → cv2.VideoWriter
+        """
+        encoder = _probe_encoder()
+        if encoder is not None:
+            cmd = [
+                _FFMPEG_BINARY, '-hide_banner', '-loglevel', 'error', '-y',
+                '-f', 'rawvideo', '-vcodec', 'rawvideo',
+                '-s', f'{w}x{h}', '-pix_fmt', 'bgr24', '-r', str(self._fps),
+                '-i', '-', '-an',
+                # yuv420p 需要偶數寬高
+                '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                '-vcodec', encoder, *_ENCODER_EXTRA_ARGS.get(encoder, []),
+                '-pix_fmt', 'yuv420p', self._video_path,
+            ]
+            try:
+                # stderr 寫入暫存檔而非 PIPE：不需另開線程讀取，也不會因緩衝區滿卡住 ffmpeg
+                self._ffmpeg_log = tempfile.TemporaryFile()
+                self._proc = subprocess.Popen(
+                    cmd, stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL, stderr=self._ffmpeg_log,
+                    creationflags=_POPEN_FLAGS
                 )
-                if not self._writer.isOpened():
-                    self._recording = False
-                    self._writer = None
-                    break
-            self._writer.write(frame)
-
-            # 2. 寫入 JPG 圖片
-            img_filename = f"frame_{frame_id:06d}.jpg"
-            img_path = os.path.join(self._image_dir, img_filename)
-            cv2.imwrite(img_path, frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
-
-            # 3. 寫入 CSV 行
-            if frame_data and self._csv_writer:
-                import time
-                ts = frame_data.get('timestamp', time.time())
-                angles = frame_data.get('angles', {})
-                row = {
-                    'frame_id': frame_id,
-                    'timestamp': f"{ts:.3f}",
-                    'datetime': datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    'neck_angle': self._fmt_angle(angles.get('neck')),
-                    'trunk_angle': self._fmt_angle(angles.get('trunk')),
-                    'upper_arm_angle': self._fmt_angle(angles.get('upper_arm')),
-                    'forearm_angle': self._fmt_angle(angles.get('forearm')),
-                    'wrist_angle': self._fmt_angle(angles.get('wrist')),
-                    'leg_angle': self._fmt_angle(angles.get('leg')),
-                    'reba_score': frame_data.get('reba_score', ''),
-                    'risk_level': frame_data.get('risk_level', ''),
-                }
-                try:
-                    self._csv_writer.writerow(row)
-                    self._csv_file.flush()
-                except Exception:
-                    pass
+                return True
+            except OSError:
+                self._proc = None
+                self._read_ffmpeg_log()
+
+        if AV_AVAILABLE and self._open_av(w, h):
+            return True
+
+        self._writer = _open_cv2_writer(self._video_path, self._fps, (w, h))
+        return self._writer is not None
+
+    def _open_av(self, w: int, h: int) -> bool:
+        """以 PyAV 開啟 H.264 輸出，編碼器啟用多線程（thread_type AUTO）"""
+        try:
+            container = av.open(self._video_path, mode='w')
+            stream = container.add_stream(
+                'h264', rate=Fraction(self._fps).limit_denominator(1001)
+            )
+            # yuv420p 需要偶數寬高，奇數時裁掉最後一列/行
+            stream.width = w - w % 2
+            stream.height = h - h % 2
+            stream.pix_fmt = 'yuv420p'
+            stream.options = {'preset': 'ultrafast', 'tune': 'zerolatency'}
+            stream.codec_context.thread_type = 'AUTO'
+            stream.codec_context.thread_count = 0  # 0 = 依 CPU 核心數自動決定
+        except Exception:
+            return False
+        self._av_container = container
+        self._av_stream = stream
+        return True
+
+    def _write_video(self, frame: np.ndarray) -> bool:
+        """寫入一幀；ffmpeg 行程已結束或編碼失敗時回傳 False"""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.write(frame.data)
+            except (BrokenPipeError, OSError, ValueError):
+                return False
+            return True
+        if self._av_container is not None:
+            stream = self._av_stream
+            if frame.shape[1] != stream.width or frame.shape[0] != stream.height:
+                frame = np.ascontiguousarray(frame[:stream.height, :stream.width])
+            try:
+                av_frame = av.VideoFrame.from_ndarray(frame, format='bgr24')
+                for packet in stream.encode(av_frame):
+                    self._av_container.mux(packet)
+            except Exception:
+                return False
+            return True
+        self._writer.write(frame)
+        return True
+
+    def _fail_video(self, reason: str):
+        """影片輸出失敗（寫入線程呼叫）：記錄原因並停用 MP4，不中斷 JPG/CSV"""
+        self._video_failed = True
+        detail = self._close_video()
+        self._video_error = f"{reason}：{detail}" if detail else reason
+
+    def _close_video(self) -> str:
+        """
+        結束影片輸出：關閉 ffmpeg stdin / 清空 PyAV 編碼器並等待編碼完成
+
+        Returns:
+            ffmpeg 異常結束時的錯誤說明（stderr 末尾），正常時為空字串
+        """
+        detail = ""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                self._proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+            if self._proc.returncode != 0:
+                detail = self._read_ffmpeg_log() or f"結束碼 {self._proc.returncode}"
+            self._proc = None
+        self._read_ffmpeg_log()  # 正常結束時只關閉暫存檔
+        if self._av_container is not None:
+            try:
+                for packet in self._av_stream.encode(None):
+                    self._av_container.mux(packet)
+            except Exception:
+                pass
+            self._av_container.close()
+            self._av_container = None
+            self._av_stream = None
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+        return detail
+
+    def _read_ffmpeg_log(self) -> str:
+        """讀取並關閉 ffmpeg stderr 暫存檔，回傳末尾幾行（以 ' / ' 串接）"""
+        log = self._ffmpeg_log
+        if log is None:
+            return ""
+        self._ffmpeg_log = None
+        try:
+            log.seek(0)
+            text = log.read().decode('utf-8', errors='replace')
+        except OSError:
+            text = ""
+        finally:
+            log.close()
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        return " / ".join(lines[-_FFMPEG_LOG_TAIL_LINES:])
+
+    def _format_datetime(self, ts: float) -> str:
+        """時間戳 → 'YYYY-mm-dd HH:MM:SS.mmm'（秒以上部分每秒只格式化一次）"""
+        sec = int(ts)
+        us = round((ts - sec) * 1_000_000)
+        if us >= 1_000_000:
+            sec += 1
+            us -= 1_000_000
+        if sec != self._dt_second:
+            self._dt_second = sec
+            self._dt_text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        return f"{self._dt_text}.{us // 1000:03d}"
 
     @staticmethod
     def _fmt_angle(val):
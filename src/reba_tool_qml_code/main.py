@@ -4,9 +4,16 @@ REBA Tool QML Code 版入口
 """
 import sys
 import os
-import json
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+# orjson 可選（較快的 JSON 解析），未安裝時退回標準庫 json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 # 必須在 QApplication 建立前設定 Fusion style，避免 Windows native style 警告
 os.environ["QT_QUICK_CONTROLS_STYLE"] = "Fusion"
 
@@ -18,10 +25,10 @@ sys.path.insert(0, str(_reba_tool_dir))
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QUrl, QObject, Slot
 from PySide6.QtGui import QPalette, QColor
 
-from bridge.image_provider import VideoImageProvider
+from bridge.video_frame_sink import VideoFrameSink
 from bridge.video_bridge import VideoBridge
 from bridge.reba_bridge import RebaBridge
 from bridge.settings_bridge import SettingsBridge
@@ -34,33 +41,117 @@ QML_DIR = HERE / "qml"
 CONFIG_DIR = HERE / "config"
 
 
+# Fusion style 深色調色盤（讓 ComboBox/SpinBox 配合深色霓虹主題）
+_PALETTE_ENTRIES = (
+    (QPalette.Window, "#0a0f1d"),
+    (QPalette.WindowText, "#e2e8f0"),
+    (QPalette.Base, "#1e2539"),
+    (QPalette.AlternateBase, "#161c2d"),
+    (QPalette.Text, "#e2e8f0"),
+    (QPalette.Button, "#1e2539"),
+    (QPalette.ButtonText, "#00f2ff"),
+    (QPalette.Highlight, "#00f2ff"),
+    (QPalette.HighlightedText, "#0a0f1d"),
+    (QPalette.Mid, "#2d3748"),
+)
+
+
+# Table C 高亮所需的兩個分數欄位（一次取出）
+_get_table_c_scores = itemgetter('score_a', 'score_b')
+
+
+class _MainHandlers(QObject):
+    """
+    main() 內部的信號處理。
+    以 @Slot 方法取代閉包/lambda，連接時走 PySide 的型別化 slot 呼叫路徑
+    （frameProcessed 每幀觸發）
+    """
+
+    def __init__(self, video_bridge, settings_bridge, data_bridge, reba_bridge,
+                 score_table_model, table_c_model, parent=None):
+        super().__init__(parent)
+        self._video_bridge = video_bridge
+        self._settings_bridge = settings_bridge
+        self._data_bridge = data_bridge
+        self._controller = video_bridge.controller
+        # 每幀呼叫：預先綁定方法，省去逐幀的屬性查找
+        self._update_scores = reba_bridge.update_from_frame
+        self._update_table = score_table_model.update_data
+        self._update_record_count = data_bridge.update_record_count
+        self._update_table_c = table_c_model.updateScores
+
+    @Slot(dict, int, str, float, dict)
+    def on_frame_processed(self, angles, reba_score, risk_level, fps, details):
+        """VideoBridge.frameProcessed → RebaBridge + ScoreTableModel + TableCModel 更新"""
+        self._update_record_count()
+        # 資料鎖定時保持目前顯示（同 Widget 版），只更新記錄數
+        if self._controller.data_locked:
+            return
+        self._update_scores(angles, reba_score, risk_level, fps, details)
+        self._update_table(angles, details)
+        # 更新 Table C 高亮（無有效分數時清除；REBAScorer 的 details 非空即含兩欄）
+        if details:
+            sa, sb = _get_table_c_scores(details)
+            if sa and sb:
+                self._update_table_c(sa, sb)
+                return
+        self._update_table_c(0, 0)
+
+    @Slot()
+    def on_data_lock_changed(self):
+        """SettingsBridge.dataLockedChanged → VideoController"""
+        self._video_bridge.controller.toggle_data_lock(self._settings_bridge.dataLocked)
+
+    @Slot()
+    def on_auto_record_changed(self):
+        """SettingsBridge.autoRecordChanged → VideoBridge（下次開始處理時生效）"""
+        self._video_bridge.setAutoRecord(self._settings_bridge.autoRecord)
+
+    @Slot()
+    def on_processing_finished(self):
+        controller = self._video_bridge.controller
+        self._data_bridge.log(f"處理完成，共處理 {controller.frame_count} 幀")
+        if controller.dropped_log_rows:
+            self._data_bridge.log(
+                f"警告: {controller.dropped_log_rows} 幀因記錄佇列已滿而未寫入資料記錄"
+            )
+
+    @Slot(str)
+    def on_error(self, msg):
+        self._data_bridge.log(f"錯誤: {msg}")
+
+
+@lru_cache(maxsize=8)
+def _load_cached(theme_path: str) -> dict:
+    """解析主題 JSON（依路徑快取，重複載入不再解析）"""
+    return _json.loads(Path(theme_path).read_bytes())
+
+
+def load_theme_json(theme_path: Path) -> dict:
+    """載入主題 JSON 配置"""
+    if theme_path.exists():
+        return _load_cached(str(theme_path))
+    return {}
+
+
 def main():
     app = QApplication(sys.argv)
 
-    # 設定 Fusion style 深色調色盤（讓 ComboBox/SpinBox 配合深色霓虹主題）
+    # 設定 Fusion style 深色調色盤
     palette = QPalette()
-    palette.setColor(QPalette.Window, QColor("#0a0f1d"))
-    palette.setColor(QPalette.WindowText, QColor("#e2e8f0"))
-    palette.setColor(QPalette.Base, QColor("#1e2539"))
-    palette.setColor(QPalette.AlternateBase, QColor("#161c2d"))
-    palette.setColor(QPalette.Text, QColor("#e2e8f0"))
-    palette.setColor(QPalette.Button, QColor("#1e2539"))
-    palette.setColor(QPalette.ButtonText, QColor("#00f2ff"))
-    palette.setColor(QPalette.Highlight, QColor("#00f2ff"))
-    palette.setColor(QPalette.HighlightedText, QColor("#0a0f1d"))
-    palette.setColor(QPalette.Mid, QColor("#2d3748"))
+    for role, color in _PALETTE_ENTRIES:
+        palette.setColor(role, QColor(color))
     app.setPalette(palette)
 
     engine = QQmlApplicationEngine()
 
     # ========== 建立 Bridge 實例 ==========
 
-    # 影像提供者
-    image_provider = VideoImageProvider()
-    engine.addImageProvider("video", image_provider)
+    # 影像輸出（QML VideoOutput 的 QVideoSink 由 videoBridge.setVideoSink 傳入）
+    frame_sink = VideoFrameSink()
 
     # 影片橋接（持有 VideoController）
-    video_bridge = VideoBridge(image_provider)
+    video_bridge = VideoBridge(frame_sink)
 
     # REBA 分數橋接
     reba_bridge = RebaBridge()
@@ -80,46 +171,27 @@ def main():
 
     # ========== 連接信號 ==========
 
-    # VideoBridge.frameProcessed → RebaBridge 更新分數
-    video_bridge.frameProcessed.connect(reba_bridge.update_from_frame)
-
-    # VideoBridge.frameProcessed → ScoreTableModel + TableCModel 更新
-    def _on_frame_for_table(frame, angles, reba_score, risk_level, fps, details):
-        score_table_model.update_data(angles, details)
-        data_bridge.update_record_count()
-        # 更新 Table C 高亮（無有效分數時清除）
-        sa = details.get('score_a') if details else None
-        sb = details.get('score_b') if details else None
-        if sa and sb:
-            table_c_model.updateScores(sa, sb)
-        else:
-            table_c_model.updateScores(0, 0)
+    # main() 內部的信號處理（掛在 app 下，生命週期同應用程式）
+    handlers = _MainHandlers(video_bridge, settings_bridge, data_bridge, reba_bridge,
+                             score_table_model, table_c_model, parent=app)
 
-    video_bridge.frameProcessed.connect(_on_frame_for_table)
+    # VideoBridge.frameProcessed → RebaBridge + ScoreTableModel + TableCModel 更新
+    video_bridge.frameProcessed.connect(handlers.on_frame_processed)
 
     # SettingsBridge → VideoBridge
     settings_bridge.parametersChanged.connect(video_bridge.setParameters)
     settings_bridge.displayOptionsChanged.connect(video_bridge.setDisplayOptions)
 
-    # SettingsBridge.dataLockedChanged → VideoController
-    def _on_data_lock_changed():
-        video_bridge.controller.toggle_data_lock(settings_bridge.dataLocked)
-    settings_bridge.dataLockedChanged.connect(_on_data_lock_changed)
+    # SettingsBridge → VideoController / VideoBridge
+    settings_bridge.dataLockedChanged.connect(handlers.on_data_lock_changed)
+    settings_bridge.autoRecordChanged.connect(handlers.on_auto_record_changed)
 
     # VideoBridge 事件日誌
-    video_bridge.processingFinished.connect(
-        lambda: data_bridge.log(
-            f"處理完成，共處理 {video_bridge.controller.frame_count} 幀"
-        )
-    )
-    video_bridge.errorOccurred.connect(
-        lambda msg: data_bridge.log(f"錯誤: {msg}")
-    )
+    video_bridge.processingFinished.connect(handlers.on_processing_finished)
+    video_bridge.errorOccurred.connect(handlers.on_error)
 
     # ========== 載入主題配置 ==========
-    theme_path = CONFIG_DIR / "theme_dark_neon.json"
-    with open(theme_path, "r", encoding="utf-8") as f:
-        theme_data = json.load(f)
+    theme_data = load_theme_json(CONFIG_DIR / "theme_dark_neon.json")
 
     # ========== 註冊到 QML Context ==========
     ctx = engine.rootContext()
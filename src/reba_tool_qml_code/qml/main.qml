@@ -116,11 +116,11 @@ ApplicationWindow {
 
             // 影片區（彈性填充）
             VideoArea {
+                id: videoArea
                 Layout.fillWidth: true
                 Layout.fillHeight: true
                 Layout.minimumWidth: 500
 
-                frameCounter: videoBridge.frameCounter
                 rebaScore: rebaBridge.rebaScore
                 riskLabel: rebaBridge.riskLevelZh
                 riskColor: rebaBridge.riskColor
@@ -264,6 +264,7 @@ ApplicationWindow {
 
     // ========== 初始化 ==========
     Component.onCompleted: {
+        videoBridge.setVideoSink(videoArea.videoSink);
         dataBridge.log("系統啟動完成");
         dataBridge.log("請選擇影片來源開始分析");
     }
@@ -1,6 +1,7 @@
 import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Layouts 1.15
+import QtMultimedia
 import "../style" as Style
 
 /**
@@ -15,7 +16,6 @@ Rectangle {
     color: "transparent"
 
     // ── 由 main.qml 綁定的屬性 ──
-    property int frameCounter: 0
     property int rebaScore: 0
     property string riskLabel: "--"
     property color riskColor: Style.Theme.textMuted
@@ -25,6 +25,9 @@ Rectangle {
     property string totalTime: "00:00"
     property bool isPlaying: false
 
+    // 供 main.qml 交給 videoBridge.setVideoSink()
+    readonly property alias videoSink: videoOutput.videoSink
+
     // ── 內部狀態 ──
     property real _pendingSeek: -1
 
@@ -120,14 +123,12 @@ Rectangle {
             }
         }
 
-        // ── 影片 Image（由 image provider 提供）──
-        Image {
-            id: videoImage
+        // ── 影片畫面（Python 端直接寫入 videoSink）──
+        VideoOutput {
+            id: videoOutput
             anchors.fill: parent
-            source: root.hasVideo ? "image://video/frame?" + root.frameCounter : ""
-            cache: false
             visible: root.hasVideo
-            fillMode: Image.PreserveAspectFit
+            fillMode: VideoOutput.PreserveAspectFit
         }
 
         // ── REBA 分數 Overlay（右上角）──